@@ -144,7 +144,7 @@ async def verify_packet(file: UploadFile = File(...)):
         # Step 4: Verify Merkle tree integrity
         merkle_valid = False
         if proof.get("merkleRoot"):
-            tree = MerkleTree()
+            tree = MerkleTree(leaf_algo=proof.get("leafAlgo", "sha256"))
             # Verify the content produces the same Merkle root
             merkle_valid = tree.verify_content_against_root(
                 content_str,
@@ -375,6 +375,7 @@ async def delete_session(slug: str):
         # Delete the entire session directory
         import shutil
         shutil.rmtree(session_dir)
+        service.storage.invalidate_session_cache()
 
         return {"success": True, "message": f"Session {slug} deleted successfully"}
 
@@ -1,6 +1,7 @@
 import hashlib
 import json
 import base64
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
@@ -9,6 +10,21 @@ import blake3
 import nacl.signing
 import nacl.encoding
 
+from .fileview import open_view
+
+# Inputs at least this large are BLAKE3-hashed on all cores; the digest is
+# the same for any thread count
+BLAKE3_MT_THRESHOLD = 1 << 20
+
+# Block size for hashing a file with SHA-256 and BLAKE3 in one pass
+HASH_BLOCK_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=64)
+def _verify_key(public_key_b64: str) -> nacl.signing.VerifyKey:
+    """Decode a base64 Ed25519 public key once per distinct signer."""
+    return nacl.signing.VerifyKey(base64.b64decode(public_key_b64))
+
 
 class HashingService:
     """Cryptographic hashing and signing service."""
@@ -18,6 +34,10 @@ class HashingService:
         self.keys_path.mkdir(parents=True, exist_ok=True)
         self.signing_key = self._get_or_create_signing_key()
 
+        # The key never changes for an instance; encode it once
+        self._public_key_b64 = base64.b64encode(bytes(self.signing_key.verify_key)).decode('ascii')
+        self._signer_block = {"type": "ed25519", "publicKey": self._public_key_b64}
+
     def _get_or_create_signing_key(self) -> nacl.signing.SigningKey:
         """Get existing Ed25519 key or create new one."""
 
@@ -40,6 +60,8 @@ class HashingService:
 
     def compute_blake3(self, data: bytes) -> str:
         """Compute BLAKE3 hash of data."""
+        if len(data) >= BLAKE3_MT_THRESHOLD:
+            return blake3.blake3(data, max_threads=blake3.blake3.AUTO).hexdigest()
         return blake3.blake3(data).hexdigest()
 
     def compute_file_hashes(self, file_path: str) -> Tuple[str, str, int]:
@@ -49,11 +71,23 @@ class HashingService:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        data = path.read_bytes()
-        sha256_hash = self.compute_sha256(data)
-        blake3_hash = self.compute_blake3(data)
+        # Hash straight from a read-only mapping instead of copying the file
+        with open_view(path) as data:
+            size = len(data)
+            sha256 = hashlib.sha256()
+            if size >= BLAKE3_MT_THRESHOLD:
+                b3 = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            else:
+                b3 = blake3.blake3()
+
+            # Feed both hashers block by block so each block is still in
+            # cache when the second hasher reads it
+            for offset in range(0, size, HASH_BLOCK_SIZE):
+                with memoryview(data)[offset:offset + HASH_BLOCK_SIZE] as block:
+                    sha256.update(block)
+                    b3.update(block)
 
-        return sha256_hash, blake3_hash, len(data)
+        return sha256.hexdigest(), b3.hexdigest(), size
 
     def sign_data(self, data: bytes) -> str:
         """Sign data with Ed25519 private key."""
@@ -71,9 +105,7 @@ class HashingService:
 
         try:
             signature = base64.b64decode(signature_b64)
-            public_key_bytes = base64.b64decode(public_key_b64)
-            verify_key = nacl.signing.VerifyKey(public_key_bytes)
-            verify_key.verify(data, signature)
+            _verify_key(public_key_b64).verify(data, signature)
             return True
         except Exception:
             return False
@@ -81,17 +113,26 @@ class HashingService:
     def get_public_key(self) -> str:
         """Get public key in base64 format."""
 
-        public_key = self.signing_key.verify_key
-        return base64.b64encode(bytes(public_key)).decode('ascii')
+        return self._public_key_b64
 
     def create_credential(
         self,
         target_file: str,
-        schema: str
+        schema: str,
+        data: Optional[bytes] = None
     ) -> Dict[str, Any]:
-        """Create a cryptographic credential for a file."""
+        """Create a cryptographic credential for a file.
 
-        sha256_hash, blake3_hash, size = self.compute_file_hashes(target_file)
+        If the file's contents are already in memory, pass them as ``data``
+        to hash them without reading the file back.
+        """
+
+        if data is None:
+            sha256_hash, blake3_hash, size = self.compute_file_hashes(target_file)
+        else:
+            sha256_hash = self.compute_sha256(data)
+            blake3_hash = self.compute_blake3(data)
+            size = len(data)
 
         credential = {
             "target": Path(target_file).name,
@@ -100,10 +141,7 @@ class HashingService:
             "size": size,
             "createdAt": datetime.utcnow().isoformat() + "Z",
             "schema": schema,
-            "signer": {
-                "type": "ed25519",
-                "publicKey": self.get_public_key()
-            }
+            "signer": dict(self._signer_block)
         }
 
         canonical_json = json.dumps(credential, sort_keys=True, separators=(',', ':'))
@@ -123,6 +161,14 @@ class HashingService:
                 credential["size"] != size):
                 return False
 
+            return self.verify_credential_signature(credential)
+        except Exception:
+            return False
+
+    def verify_credential_signature(self, credential: Dict[str, Any]) -> bool:
+        """Verify a credential's signature without re-hashing its target file."""
+
+        try:
             cred_copy = credential.copy()
             signature = cred_copy.pop("signature")
 
@@ -0,0 +1,69 @@
+import datetime
+import json
+import math
+from json.encoder import _make_iterencode, encode_basestring
+from typing import Any
+
+
+def _float_str(value: float) -> str:
+    """Format a float the way orjson does.
+
+    That is Python's shortest repr, except that exponents carry no '+' or
+    leading zeros, e-05 values are written out in full (0.0000...), and
+    non-finite values become null.
+    """
+
+    if not math.isfinite(value):
+        return "null"
+
+    text = repr(value)
+    if "e" not in text:
+        return text
+
+    mantissa, exponent = text.split("e")
+    exponent = int(exponent)
+    if exponent == -5:
+        sign = "-" if mantissa.startswith("-") else ""
+        return f"{sign}0.0000{mantissa.lstrip('-').replace('.', '')}"
+
+    return f"{mantissa}e{exponent}"
+
+
+class _OrjsonCompatEncoder(json.JSONEncoder):
+    """Stdlib encoder producing the same bytes as the orjson path of ``dumps``."""
+
+    def iterencode(self, o, _one_shot=False):
+        markers = {} if self.check_circular else None
+        return _make_iterencode(
+            markers, self.default, encode_basestring, self.indent, _float_str,
+            self.key_separator, self.item_separator, self.sort_keys,
+            self.skipkeys, _one_shot
+        )(o, 0)
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
+            return o.isoformat()
+        # numpy scalars and arrays
+        tolist = getattr(o, "tolist", None)
+        if tolist is not None:
+            return tolist()
+        return super().default(o)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes with the stdlib encoder."""
+    return json.dumps(obj, indent=2, ensure_ascii=False, cls=_OrjsonCompatEncoder).encode('utf-8')
+
+
+# Signed artifacts are hashed as written, so both paths must emit identical bytes
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize to indented UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+    loads = orjson.loads
+except ImportError:
+    dumps = _json_dumps
+    loads = json.loads
@@ -3,6 +3,7 @@ Real audio recording for macOS using system tools.
 Records actual microphone input and transcribes using Whisper API.
 """
 
+import shutil
 import subprocess
 import threading
 import time
@@ -18,6 +19,11 @@ import struct
 from .service import VeriMinutesService
 
 
+# Resolve recorder binaries once at import instead of spawning `which`
+_SOX_PATH = shutil.which("sox")
+_FFMPEG_PATH = shutil.which("ffmpeg")
+
+
 class MacOSMeetingRecorder:
     """
     Records real audio on macOS and transcribes it.
@@ -50,10 +56,10 @@ class MacOSMeetingRecorder:
 
         try:
             # Try using sox first (best quality)
-            if self._check_command_exists("sox"):
+            if _SOX_PATH is not None:
                 return self._start_sox_recording()
             # Try ffmpeg as fallback
-            elif self._check_command_exists("ffmpeg"):
+            elif _FFMPEG_PATH is not None:
                 return self._start_ffmpeg_recording()
             # Try using macOS's built-in say and record
             else:
@@ -65,11 +71,7 @@ class MacOSMeetingRecorder:
 
     def _check_command_exists(self, command: str) -> bool:
         """Check if a command exists on the system."""
-        try:
-            subprocess.run(["which", command], check=True, capture_output=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+        return shutil.which(command) is not None
 
     def _start_sox_recording(self) -> Dict:
         """Start recording with sox."""
@@ -77,7 +79,7 @@ class MacOSMeetingRecorder:
 
         # Start sox recording process
         self.recording_process = subprocess.Popen([
-            "sox", "-d", "-r", "16000", "-c", "1", "-b", "16", self.audio_file
+            _SOX_PATH, "-d", "-r", "16000", "-c", "1", "-b", "16", self.audio_file
         ])
 
         self.is_recording = True
@@ -97,7 +99,7 @@ class MacOSMeetingRecorder:
         # Get default audio input device
         # On macOS, device is usually ":0" for default mic
         self.recording_process = subprocess.Popen([
-            "ffmpeg", "-f", "avfoundation", "-i", ":0",
+            _FFMPEG_PATH, "-f", "avfoundation", "-i", ":0",
             "-ar", "16000", "-ac", "1", "-y", self.audio_file
         ], stderr=subprocess.DEVNULL)
 
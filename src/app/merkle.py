@@ -1,18 +1,65 @@
 import hashlib
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from pathlib import Path
 import math
 
+import blake3
+
+from .fileview import open_view
+
+
+def _sha256_digest(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+# Fresh hasher state cloned per leaf; copying is cheaper than constructing
+_BLAKE3_BASE = blake3.blake3()
+
+
+def _blake3_digest(data: bytes) -> bytes:
+    hasher = _BLAKE3_BASE.copy()
+    hasher.update(data)
+    return hasher.digest()
+
+
+# Leaf/node hash functions by proof "leafAlgo"; both produce 32-byte digests
+DIGEST_SIZE = 32
+LEAF_HASHERS: Dict[str, Callable[[bytes], bytes]] = {
+    "sha256": _sha256_digest,
+    "blake3": _blake3_digest,
+}
+
+# Hash constructors for interior nodes, called inline in the pairing loops
+NODE_HASHERS: Dict[str, Callable[[bytes], Any]] = {
+    "sha256": hashlib.sha256,
+    "blake3": blake3.blake3,
+}
+
 
 class MerkleTree:
-    """Merkle tree implementation with 64KB chunking and inclusion proofs."""
+    """Merkle tree implementation with 64KB chunking and inclusion proofs.
+
+    Leaves and interior nodes are hashed with ``leaf_algo``: BLAKE3 by
+    default, or SHA-256. Proofs record the algorithm, and verification
+    follows it; proofs without a ``leafAlgo`` field are SHA-256.
+    """
+
+    def __init__(self, chunk_size: int = 65536, leaf_algo: str = "blake3"):
+        if leaf_algo not in LEAF_HASHERS:
+            raise ValueError(f"Unsupported leaf algorithm: {leaf_algo}")
 
-    def __init__(self, chunk_size: int = 65536):
         self.chunk_size = chunk_size
+        self.leaf_algo = leaf_algo
+        self._digest = LEAF_HASHERS[leaf_algo]
+        self._node_hash = NODE_HASHERS[leaf_algo]
         self.leaves: List[str] = []
-        self.tree: List[List[str]] = []
         self.root: Optional[str] = None
 
+        # Raw leaf digests; interior levels are only materialized by ``tree``
+        self._leaf_digests: List[bytes] = []
+        self._levels: Optional[List[List[bytes]]] = None
+        self._first_path = b""
+
     def build_from_file(self, file_path: str) -> Dict[str, Any]:
         """Build Merkle tree from file using chunking."""
 
@@ -20,18 +67,26 @@ class MerkleTree:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        data = path.read_bytes()
-        chunks = self._chunk_data(data)
-        self.leaves = [self._hash_chunk(chunk) for chunk in chunks]
+        # Chunks are memoryview slices of the mapping, hashed without copies
+        with open_view(path) as data:
+            return self.build_from_bytes(data, path.name)
+
+    def build_from_bytes(self, data: bytes, doc_path: str) -> Dict[str, Any]:
+        """Build Merkle tree from in-memory file contents (bytes or a memoryview)."""
+
+        digest = self._digest
+        size = self.chunk_size
+        digests = [digest(data[i:i + size]) for i in range(0, len(data), size)] or [digest(b'')]
+        self.leaves = [d.hex() for d in digests]
 
-        self._build_tree()
+        self._build_tree(digests)
 
         inclusion = self._generate_inclusion_proof(0) if self.leaves else {}
 
         return {
-            "docPath": path.name,
+            "docPath": doc_path,
             "chunkSize": self.chunk_size,
-            "leafAlgo": "sha256",
+            "leafAlgo": self.leaf_algo,
             "leaves": self.leaves,
             "merkleRoot": self.root or "",
             "inclusion": inclusion
@@ -51,49 +106,97 @@ class MerkleTree:
         return chunks
 
     def _hash_chunk(self, chunk: bytes) -> str:
-        """Hash a chunk using SHA-256."""
-        return hashlib.sha256(chunk).hexdigest()
+        """Hash a chunk with the tree's leaf algorithm."""
+        return self._digest(chunk).hex()
 
     def _hash_pair(self, left: str, right: str) -> str:
         """Hash two nodes together."""
 
         combined = bytes.fromhex(left) + bytes.fromhex(right)
-        return hashlib.sha256(combined).hexdigest()
+        return self._digest(combined).hex()
 
-    def _build_tree(self):
-        """Build the Merkle tree from leaves."""
+    def _pair_level(self, level: List[bytes]) -> List[bytes]:
+        """Hash adjacent digests into the parent level (odd tail pairs with itself)."""
 
-        if not self.leaves:
-            self.root = ""
-            return
+        new = self._node_hash
+        if len(level) % 2:
+            level = level + level[-1:]
 
-        if len(self.leaves) == 1:
-            self.root = self.leaves[0]
-            self.tree = [self.leaves]
-            return
+        return [new(left + right).digest() for left, right in zip(level[0::2], level[1::2])]
 
-        self.tree = [self.leaves[:]]
+    def _build_tree(self, digests: List[bytes]):
+        """Fold raw leaf digests into the root through an O(log n) edge of pending nodes.
 
-        current_level = self.leaves[:]
+        ``edge[h]`` holds a left node at height h still waiting for its right
+        sibling. Interior levels are not kept; the fold records the sibling
+        path of leaf 0 as it is produced, and ``tree`` rebuilds the full
+        levels only when asked.
+        """
 
-        while len(current_level) > 1:
-            next_level = []
+        self._leaf_digests = digests
+        self._levels = None
 
-            for i in range(0, len(current_level), 2):
-                if i + 1 < len(current_level):
-                    left = current_level[i]
-                    right = current_level[i + 1]
-                else:
-                    left = current_level[i]
-                    right = current_level[i]
+        if not digests:
+            self.root = ""
+            self._first_path = b""
+            return
+
+        new = self._node_hash
+        depth = (len(digests) - 1).bit_length()
+        first_path: List[bytes] = []
+        edge: List[Optional[bytes]] = []
+
+        for node in digests:
+            height = 0
+            while True:
+                if height == len(edge):
+                    edge.append(node)
+                    break
+                left = edge[height]
+                if left is None:
+                    edge[height] = node
+                    break
+                # The first pairing at each height is on leaf 0's path
+                if len(first_path) == height:
+                    first_path.append(node)
+                node = new(left + node).digest()
+                edge[height] = None
+                height += 1
+
+        # Close the ragged right edge; an odd tail pairs with itself
+        top = len(edge) - 1
+        carry: Optional[bytes] = None
+        for height in range(top + 1):
+            node = edge[height]
+            if node is None:
+                if carry is None:
+                    continue
+                left, right = carry, carry
+            elif carry is None:
+                if height == top:
+                    carry = node
+                    break
+                left, right = node, node
+            else:
+                left, right = node, carry
+            if len(first_path) == height:
+                first_path.append(right)
+            carry = new(left + right).digest()
+
+        self.root = carry.hex()
+        self._first_path = b"".join(first_path)
 
-                parent = self._hash_pair(left, right)
-                next_level.append(parent)
+    @property
+    def tree(self) -> List[List[bytes]]:
+        """All levels of the last built tree, leaves first (built on first use)."""
 
-            self.tree.append(next_level)
-            current_level = next_level
+        if self._levels is None:
+            levels = [self._leaf_digests] if self._leaf_digests else []
+            while levels and len(levels[-1]) > 1:
+                levels.append(self._pair_level(levels[-1]))
+            self._levels = levels
 
-        self.root = current_level[0] if current_level else ""
+        return self._levels
 
     def _generate_inclusion_proof(
         self,
@@ -104,32 +207,57 @@ class MerkleTree:
         if leaf_index >= len(self.leaves):
             return {}
 
+        # Hex strings only for the JSON form; the path itself is raw bytes
+        siblings, positions = self._inclusion_path(leaf_index)
+        depth = len(siblings) // DIGEST_SIZE
+
+        return {
+            "leafIndex": leaf_index,
+            "offsets": ["left" if (positions >> i) & 1 else "right" for i in range(depth)],
+            "siblings": [
+                siblings[i:i + DIGEST_SIZE].hex()
+                for i in range(0, len(siblings), DIGEST_SIZE)
+            ]
+        }
+
+    def _inclusion_path(self, leaf_index: int) -> Tuple[bytes, int]:
+        """Return a leaf's sibling digests packed back to back, plus a side bitmask.
+
+        Bit i of the mask is set when the sibling at level i sits on the left.
+        A node without a sibling (odd tail) is paired with itself.
+        """
+
+        if leaf_index == 0:
+            return self._first_path, 0
+
         siblings = []
-        offsets = []
+        positions = 0
         current_index = leaf_index
 
         for level in range(len(self.tree) - 1):
-            level_size = len(self.tree[level])
+            nodes = self.tree[level]
+            sibling_index = current_index ^ 1
 
-            if current_index % 2 == 0:
-                sibling_index = current_index + 1
-                offsets.append("right")
-            else:
-                sibling_index = current_index - 1
-                offsets.append("left")
+            if current_index & 1:
+                positions |= 1 << level
 
-            if sibling_index < level_size:
-                siblings.append(self.tree[level][sibling_index])
-            else:
-                siblings.append(self.tree[level][current_index])
+            siblings.append(nodes[sibling_index] if sibling_index < len(nodes) else nodes[current_index])
+            current_index >>= 1
 
-            current_index = current_index // 2
+        return b"".join(siblings), positions
 
-        return {
-            "leafIndex": leaf_index,
-            "offsets": offsets,
-            "siblings": siblings
-        }
+    def _walk_path(self, current: bytes, siblings: bytes, positions: int, steps: int) -> bytes:
+        """Hash ``current`` up ``steps`` levels of a packed sibling path."""
+
+        digest = self._digest
+        for i in range(steps):
+            sibling = siblings[i * DIGEST_SIZE:(i + 1) * DIGEST_SIZE]
+            if (positions >> i) & 1:
+                current = digest(sibling + current)
+            else:
+                current = digest(current + sibling)
+
+        return current
 
     def verify_inclusion(
         self,
@@ -140,17 +268,24 @@ class MerkleTree:
         """Verify that a leaf is included in the tree."""
 
         try:
-            current = leaf
-            siblings = proof.get("siblings", [])
+            current = bytes.fromhex(leaf)
+            sibling_hexes = proof.get("siblings", [])
             offsets = proof.get("offsets", [])
+            depth = min(len(sibling_hexes), len(offsets))
 
-            for sibling, offset in zip(siblings, offsets):
-                if offset == "right":
-                    current = self._hash_pair(current, sibling)
-                else:
-                    current = self._hash_pair(sibling, current)
+            # One fromhex call for the whole path, then 32-byte strides
+            siblings = bytes.fromhex("".join(sibling_hexes[:depth]))
+            if len(siblings) != depth * DIGEST_SIZE:
+                return False
+            positions = 0
+            for i, offset in enumerate(offsets[:depth]):
+                if offset != "right":
+                    positions |= 1 << i
 
-            return current == root
+            # Every sibling is replayed; no shortcut through this instance's state
+            current = self._walk_path(current, siblings, positions, depth)
+
+            return current.hex() == root
         except Exception:
             return False
 
@@ -162,13 +297,61 @@ class MerkleTree:
         """Verify a Merkle proof against a file."""
 
         try:
-            tree = MerkleTree(chunk_size=proof.get("chunkSize", 65536))
+            tree = MerkleTree(
+                chunk_size=proof.get("chunkSize", 65536),
+                leaf_algo=proof.get("leafAlgo", "sha256")
+            )
             result = tree.build_from_file(file_path)
 
             return result["merkleRoot"] == proof["merkleRoot"]
         except Exception:
             return False
 
+    def verify_proof_with_digest(
+        self,
+        file_path: str,
+        proof: Dict[str, Any]
+    ) -> Tuple[bool, str, str, int]:
+        """Verify a Merkle proof and hash the whole file in a single read.
+
+        Returns whether the recomputed root matches the proof, together with
+        the file's SHA-256 and BLAKE3 hex digests and its size in bytes (the
+        fields a credential records). The proof's chunk size and leaf
+        algorithm are adopted, and the recomputed root is left in ``self.root``.
+        """
+
+        try:
+            self.chunk_size = proof.get("chunkSize", self.chunk_size)
+            self.leaf_algo = proof.get("leafAlgo", "sha256")
+            self._digest = LEAF_HASHERS[self.leaf_algo]
+            self._node_hash = NODE_HASHERS[self.leaf_algo]
+            doc_sha256 = hashlib.sha256()
+            doc_blake3 = blake3.blake3()
+            size = 0
+            digests = []
+
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(self.chunk_size), b''):
+                    doc_sha256.update(chunk)
+                    doc_blake3.update(chunk)
+                    size += len(chunk)
+                    digests.append(self._digest(chunk))
+
+            if not digests:
+                digests = [self._digest(b'')]
+
+            self.leaves = [d.hex() for d in digests]
+            self._build_tree(digests)
+
+            return (
+                self.root == proof["merkleRoot"],
+                doc_sha256.hexdigest(),
+                doc_blake3.hexdigest(),
+                size
+            )
+        except Exception:
+            return False, "", "", 0
+
     def verify_content_against_root(
         self,
         content: str,
@@ -179,8 +362,9 @@ class MerkleTree:
             # Convert content to bytes and build tree
             data = content.encode('utf-8')
             chunks = self._chunk_data(data)
-            self.leaves = [self._hash_chunk(chunk) for chunk in chunks]
-            self._build_tree()
+            digests = [self._digest(chunk) for chunk in chunks]
+            self.leaves = [d.hex() for d in digests]
+            self._build_tree(digests)
 
             # Check if computed root matches expected
             return self.root == expected_root
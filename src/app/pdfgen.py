@@ -5,18 +5,29 @@ from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.platypus import (
     SimpleDocTemplate, Table, TableStyle, Paragraph,
-    Spacer, PageBreak, KeepTogether
+    Spacer, PageBreak, KeepTogether, HRFlowable
 )
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 
 from .schema import BoardMinutes_v1
 
 
+def _truncate(s: str, n: int = 100) -> str:
+    """Shorten text to ``n`` characters, marking the cut with an ellipsis."""
+    return s if len(s) <= n else s[:n] + "..."
+
+
 class PDFGenerator:
     """Generate professional PDF documents from board minutes."""
 
+    # Table body font and default cell padding (reportlab's Table defaults)
+    CELL_FONT = 'Helvetica'
+    CELL_FONT_SIZE = 10
+    CELL_PADDING = 6
+
     def __init__(self):
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
@@ -51,6 +62,27 @@ class PDFGenerator:
             alignment=TA_CENTER
         ))
 
+    def _cell(self, text: str, col_width: float):
+        """Wrap cell text in a Paragraph unless it fits on one line of the column.
+
+        Plain strings never wrap in a Table, so they are only used when the
+        measured width fits inside the padded column and no markup is present.
+        """
+        fits = stringWidth(text, self.CELL_FONT, self.CELL_FONT_SIZE) <= col_width - 2 * self.CELL_PADDING
+        if not fits or '<' in text or '&' in text or '\n' in text:
+            return Paragraph(text, self.styles['Normal'])
+        return text
+
+    def _rule(self) -> HRFlowable:
+        """Thin horizontal rule drawn as a single line primitive."""
+        return HRFlowable(
+            width="100%",
+            thickness=0.5,
+            color=colors.HexColor('#7f8c8d'),
+            spaceBefore=6,
+            spaceAfter=6
+        )
+
     def generate_pdf(
         self,
         minutes: BoardMinutes_v1,
@@ -74,10 +106,11 @@ class PDFGenerator:
 
         story.append(Paragraph(minutes.title, self.styles['CustomTitle']))
 
-        meeting_info = f"<b>Date:</b> {minutes.date}<br/>"
-        meeting_info += f"<b>Attendees:</b> {', '.join(minutes.attendees)}<br/>"
-        if minutes.absent:
-            meeting_info += f"<b>Absent:</b> {', '.join(minutes.absent)}<br/>"
+        meeting_info = (
+            f"<b>Date:</b> {minutes.date}<br/>"
+            f"<b>Attendees:</b> {', '.join(minutes.attendees)}<br/>"
+            + (f"<b>Absent:</b> {', '.join(minutes.absent)}<br/>" if minutes.absent else "")
+        )
 
         story.append(Paragraph(meeting_info, self.styles['Normal']))
         story.append(Spacer(1, 0.3 * inch))
@@ -93,16 +126,16 @@ class PDFGenerator:
             motion_data = []
             motion_data.append(['Motion', 'Moved By', 'Seconded By', 'Result'])
 
+            motion_widths = [3.5*inch, 1.5*inch, 1.5*inch, 1*inch]
             for motion in minutes.motions:
                 motion_data.append([
-                    Paragraph(motion.text[:100] + "..." if len(motion.text) > 100 else motion.text,
-                             self.styles['Normal']),
+                    self._cell(_truncate(motion.text), motion_widths[0]),
                     motion.movedBy or "—",
                     motion.secondedBy or "—",
                     motion.vote.result
                 ])
 
-            motion_table = Table(motion_data, colWidths=[3.5*inch, 1.5*inch, 1.5*inch, 1*inch])
+            motion_table = Table(motion_data, colWidths=motion_widths)
             motion_table.setStyle(TableStyle([
                 ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
                 ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -127,14 +160,15 @@ class PDFGenerator:
             action_data = []
             action_data.append(['Action', 'Owner', 'Due Date'])
 
+            action_widths = [4*inch, 1.5*inch, 1.5*inch]
             for action in minutes.actions:
                 action_data.append([
-                    Paragraph(action.text, self.styles['Normal']),
+                    self._cell(action.text, action_widths[0]),
                     action.owner,
                     action.due or "TBD"
                 ])
 
-            action_table = Table(action_data, colWidths=[4*inch, 1.5*inch, 1.5*inch])
+            action_table = Table(action_data, colWidths=action_widths)
             action_table.setStyle(TableStyle([
                 ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
                 ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -172,34 +206,35 @@ class PDFGenerator:
         from datetime import datetime, timezone
         stamp_time = datetime.now(timezone.utc).isoformat()
 
-        story.append(Paragraph("─" * 80, self.styles['Normal']))
+        story.append(self._rule())
         story.append(Paragraph("CRYPTOGRAPHIC VERIFICATION STAMP", self.styles['SectionHeader']))
 
-        footer_text = "<b>Generated by BlackBox</b><br/>"
-        footer_text += f"<b>Stamped at:</b> {stamp_time}<br/><br/>"
+        footer_parts = ["<b>Generated by BlackBox</b><br/>"]
+        footer_parts.append(f"<b>Stamped at:</b> {stamp_time}<br/><br/>")
 
         if credential:
-            footer_text += "<b>Document Hashes:</b><br/>"
-            footer_text += f"SHA-256: {credential.get('sha256', '')}<br/>"
-            footer_text += f"BLAKE3: {credential.get('blake3', '')}<br/><br/>"
+            footer_parts.append("<b>Document Hashes:</b><br/>")
+            footer_parts.append(f"SHA-256: {credential.get('sha256', '')}<br/>")
+            footer_parts.append(f"BLAKE3: {credential.get('blake3', '')}<br/><br/>")
 
-            footer_text += "<b>Digital Signature:</b><br/>"
-            footer_text += f"Public Key: {credential.get('signer', {}).get('publicKey', '')}<br/>"
-            footer_text += f"Signature: {credential.get('signature', '')[:32]}...<br/><br/>"
+            footer_parts.append("<b>Digital Signature:</b><br/>")
+            footer_parts.append(f"Public Key: {credential.get('signer', {}).get('publicKey', '')}<br/>")
+            footer_parts.append(f"Signature: {credential.get('signature', '')[:32]}...<br/><br/>")
 
         if proof:
-            footer_text += "<b>Merkle Tree Verification:</b><br/>"
-            footer_text += f"Root Hash: {proof.get('merkleRoot', '')}<br/>"
-            footer_text += f"Leaf Count: {len(proof.get('leaves', []))}<br/><br/>"
+            footer_parts.append("<b>Merkle Tree Verification:</b><br/>")
+            footer_parts.append(f"Root Hash: {proof.get('merkleRoot', '')}<br/>")
+            footer_parts.append(f"Leaf Count: {len(proof.get('leaves', []))}<br/><br/>")
 
         if anchor_receipt:
-            footer_text += "<b>Blockchain Anchor:</b><br/>"
-            footer_text += f"Transaction: {anchor_receipt.get('txHash', '')}<br/>"
-            footer_text += f"Chain ID: {anchor_receipt.get('chainId', '')}<br/>"
-            footer_text += f"Contract: {anchor_receipt.get('contractAddress', '')}<br/>"
+            footer_parts.append("<b>Blockchain Anchor:</b><br/>")
+            footer_parts.append(f"Transaction: {anchor_receipt.get('txHash', '')}<br/>")
+            footer_parts.append(f"Chain ID: {anchor_receipt.get('chainId', '')}<br/>")
+            footer_parts.append(f"Contract: {anchor_receipt.get('contractAddress', '')}<br/>")
 
+        footer_text = "".join(footer_parts)
         story.append(Paragraph(footer_text, self.styles['Footer']))
-        story.append(Paragraph("─" * 80, self.styles['Normal']))
+        story.append(self._rule())
 
         doc.build(story)
 
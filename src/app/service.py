@@ -1,4 +1,4 @@
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 
@@ -9,9 +9,10 @@ from .merkle import MerkleTree
 from .storage import StorageService
 from .pdfgen import PDFGenerator
 from .anchor import AnchorService
+from .jsonio import loads
 from .schema import (
     Transcript_v1, BoardMinutes_v1, VerificationPacket,
-    VerificationResult
+    VerificationResult, Credential, Signer, MerkleProof, AnchorReceipt
 )
 
 
@@ -67,21 +68,27 @@ class VeriMinutesService:
 
         paths = {}
 
-        transcript_data = self.storage.read_artifact(slug, "transcript.normalized.json")
-        transcript = Transcript_v1(**transcript_data)
+        session_dir = self.storage.get_session_dir(slug)
+        manifest = self.storage.get_manifest(slug)
+        transcript_path = session_dir / "transcript.normalized.json"
 
-        original_file = self.storage.get_manifest(slug)["artifacts"][0].get("path", "unknown.txt")
+        transcript_content = transcript_path.read_bytes()
+        transcript = Transcript_v1(**loads(transcript_content))
+
+        original_file = manifest["artifacts"][0].get("path", "unknown.txt")
 
         minutes = self.structurer.structure_transcript(transcript, original_file)
-        paths["minutes"] = self.storage.store_artifact(
+        minutes_dict = minutes.model_dump()
+        paths["minutes"], minutes_content = self.storage.store_artifact_returning_bytes(
             slug,
             "minutes.json",
-            minutes.model_dump()
+            minutes_dict
         )
 
         transcript_cred = self.hasher.create_credential(
-            self.storage.get_session_dir(slug) / "transcript.normalized.json",
-            "Transcript_v1"
+            transcript_path,
+            "Transcript_v1",
+            data=transcript_content
         )
         paths["transcript_cred"] = self.storage.store_artifact(
             slug,
@@ -91,7 +98,8 @@ class VeriMinutesService:
 
         minutes_cred = self.hasher.create_credential(
             paths["minutes"],
-            "BoardMinutes_v1"
+            "BoardMinutes_v1",
+            data=minutes_content
         )
         paths["minutes_cred"] = self.storage.store_artifact(
             slug,
@@ -99,18 +107,14 @@ class VeriMinutesService:
             minutes_cred
         )
 
-        transcript_content = Path(self.storage.get_session_dir(slug) / "transcript.normalized.json").read_bytes()
-        self.storage.store_in_cas(slug, "sha256", transcript_cred["sha256"], transcript_content)
-        self.storage.store_in_cas(slug, "blake3", transcript_cred["blake3"], transcript_content)
+        cas_path = self.storage.store_in_cas(slug, "sha256", transcript_cred["sha256"], transcript_content)
+        self.storage.link_alias(cas_path, "blake3", transcript_cred["blake3"])
 
-        minutes_content = Path(paths["minutes"]).read_bytes()
-        self.storage.store_in_cas(slug, "sha256", minutes_cred["sha256"], minutes_content)
-        self.storage.store_in_cas(slug, "blake3", minutes_cred["blake3"], minutes_content)
+        cas_path = self.storage.store_in_cas(slug, "sha256", minutes_cred["sha256"], minutes_content)
+        self.storage.link_alias(cas_path, "blake3", minutes_cred["blake3"])
 
         tree = MerkleTree()
-        transcript_proof = tree.build_from_file(
-            self.storage.get_session_dir(slug) / "transcript.normalized.json"
-        )
+        transcript_proof = tree.build_from_bytes(transcript_content, transcript_path.name)
         paths["transcript_proof"] = self.storage.store_artifact(
             slug,
             "transcript.proof.json",
@@ -118,7 +122,7 @@ class VeriMinutesService:
         )
 
         tree = MerkleTree()
-        minutes_proof = tree.build_from_file(paths["minutes"])
+        minutes_proof = tree.build_from_bytes(minutes_content, "minutes.json")
         paths["minutes_proof"] = self.storage.store_artifact(
             slug,
             "minutes.proof.json",
@@ -141,10 +145,6 @@ class VeriMinutesService:
                     receipt
                 )
 
-        # Load the full transcript to include in packet
-        transcript_data = self.storage.read_artifact(slug, "transcript.normalized.json")
-        transcript = Transcript_v1(**transcript_data)
-
         # Create hash stamps for verification
         from datetime import datetime, timezone
         stamp_time = datetime.now(timezone.utc).isoformat()
@@ -158,23 +158,30 @@ class VeriMinutesService:
             "stamped_at": stamp_time
         }
 
-        packet = VerificationPacket(
+        # Every part of the packet was produced above, so skip revalidation
+        packet = VerificationPacket.model_construct(
             minutes=minutes,
             transcriptRef="transcript.normalized.json",
             transcript=transcript,
-            credential=minutes_cred,
-            proof=minutes_proof,
-            anchorReceipt=anchor_receipt,
+            credential=Credential.model_construct(**{
+                **minutes_cred,
+                "signer": Signer.model_construct(**minutes_cred["signer"])
+            }),
+            proof=MerkleProof.model_construct(**minutes_proof),
+            anchorReceipt=(
+                AnchorReceipt.model_construct(**anchor_receipt)
+                if anchor_receipt else None
+            ),
             stampedAt=stamp_time,
             hashStamp=hash_stamps
         )
         paths["packet"] = self.storage.store_artifact(
             slug,
             "minutes.packet.json",
-            packet.model_dump()
+            packet.model_dump_json(indent=2)
         )
 
-        pdf_path = self.storage.get_session_dir(slug) / "minutes.pdf"
+        pdf_path = session_dir / "minutes.pdf"
         self.pdf_gen.generate_pdf(
             minutes,
             str(pdf_path),
@@ -184,16 +191,28 @@ class VeriMinutesService:
         )
         paths["pdf"] = str(pdf_path)
 
-        for artifact_type, path in paths.items():
-            if path:
-                self.storage.update_manifest(
-                    slug,
-                    artifact_type,
-                    Path(path).name
-                )
+        with self.storage.manifest_batch(slug) as manifest_batch:
+            for artifact_type, path in paths.items():
+                if path:
+                    manifest_batch.add(artifact_type, Path(path).name)
 
         return paths
 
+    def _lookup_anchor(self, slug: str, merkle_root: str) -> Tuple[Optional[str], Optional[str]]:
+        """Return (on-chain root, tx hash) for a session's anchor receipt."""
+
+        on_chain_root = None
+        tx_hash = None
+
+        try:
+            receipt = self.storage.read_artifact(slug, "anchor_receipt.json")
+            tx_hash = receipt.get("txHash")
+            on_chain_root = self.anchor.verify_anchor(merkle_root, tx_hash)
+        except:
+            pass
+
+        return on_chain_root, tx_hash
+
     def verify_artifacts(self, slug: str) -> VerificationResult:
         """Verify all artifacts for a session."""
 
@@ -204,34 +223,43 @@ class VeriMinutesService:
             minutes_proof = self.storage.read_artifact(slug, "minutes.proof.json")
 
             minutes_path = session_dir / "minutes.json"
-            cred_valid = self.hasher.verify_credential(minutes_cred, str(minutes_path))
 
-            tree = MerkleTree()
-            proof_valid = tree.verify_proof(str(minutes_path), minutes_proof)
+            # The pool only starts a thread when the anchor lookup is submitted
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                anchor_future = None
+                if self.anchor.is_enabled():
+                    # Network-bound; runs while the file is hashed below
+                    anchor_future = pool.submit(
+                        self._lookup_anchor, slug, minutes_proof["merkleRoot"]
+                    )
 
-            on_chain_root = None
-            tx_hash = None
+                # One pass over the file yields both the Merkle root and the
+                # digests and size the credential was signed over
+                tree = MerkleTree()
+                proof_valid, doc_sha256, doc_blake3, doc_size = tree.verify_proof_with_digest(
+                    str(minutes_path),
+                    minutes_proof
+                )
+                cred_valid = (
+                    doc_sha256 == minutes_cred["sha256"] and
+                    doc_blake3 == minutes_cred["blake3"] and
+                    doc_size == minutes_cred["size"] and
+                    self.hasher.verify_credential_signature(minutes_cred)
+                )
 
-            if self.anchor.is_enabled():
-                try:
-                    receipt = self.storage.read_artifact(slug, "anchor_receipt.json")
-                    tx_hash = receipt.get("txHash")
-                    on_chain_root = self.anchor.verify_anchor(
-                        minutes_proof["merkleRoot"],
-                        tx_hash
-                    )
-                except:
-                    pass
+                on_chain_root, tx_hash = (
+                    anchor_future.result() if anchor_future else (None, None)
+                )
 
-            return VerificationResult(
+            return VerificationResult.model_construct(
                 valid=cred_valid and proof_valid,
-                localRoot=minutes_proof["merkleRoot"],
+                localRoot=tree.root or "",
                 onChainRoot=on_chain_root,
                 docHash=minutes_cred["sha256"],
                 txHash=tx_hash
             )
         except Exception as e:
-            return VerificationResult(
+            return VerificationResult.model_construct(
                 valid=False,
                 localRoot="",
                 onChainRoot=None,
@@ -3,18 +3,99 @@ Simplified meeting recorder that works with system audio.
 Uses system commands for recording and basic transcription.
 """
 
+import shutil
 import subprocess
 import threading
 import time
 import json
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple, Union
 import tempfile
 import os
+import wave
 
 from .service import VeriMinutesService
 
+if TYPE_CHECKING:
+    # numpy is imported lazily at runtime; this only resolves annotations
+    import numpy as np
+
+
+# Resolve ffmpeg once at import instead of spawning `which` per recording
+_FFMPEG_PATH = shutil.which("ffmpeg")
+
+# Last audio input that worked, so later recordings skip device probing
+_DEVICE_CACHE_FILE = Path("~/.veriminutes/audio_device").expanduser()
+
+# "[AVFoundation indev @ 0x...] [1] MacBook Pro Microphone"
+_DEVICE_RE = re.compile(r"\[(\d+)\]\s+(.+)")
+
+_audio_devices: Optional[List[str]] = None
+
+
+def _list_audio_devices() -> List[str]:
+    """Enumerate avfoundation audio device indices (once per process)."""
+    global _audio_devices
+
+    if _audio_devices is None:
+        list_devices = subprocess.run([
+            _FFMPEG_PATH, "-f", "avfoundation", "-list_devices", "true", "-i", ""
+        ], capture_output=True, text=True)
+
+        print("📱 Available audio devices:")
+        _audio_devices = []
+        in_audio_section = False
+        for line in list_devices.stderr.splitlines():
+            if 'audio devices' in line.lower():
+                in_audio_section = True
+                continue
+            match = _DEVICE_RE.search(line) if in_audio_section else None
+            if match:
+                print(f"  [{match.group(1)}] {match.group(2).strip()}")
+                _audio_devices.append(match.group(1))
+
+    return _audio_devices
+
+
+def _drain(stream, buf: deque):
+    """Read a pipe to EOF in 64 KB chunks, keeping only the most recent ones."""
+    for chunk in iter(lambda: stream.read1(1 << 16), b''):
+        buf.append(chunk)
+
+
+def _capture(stream, pcm: bytearray):
+    """Append raw PCM from ffmpeg's stdout to an in-memory buffer until EOF."""
+    for chunk in iter(lambda: stream.read1(1 << 16), b''):
+        pcm += chunk
+
+
+def _write_wav(path: str, pcm: bytes, sample_rate: int = 16000):
+    """Wrap mono s16le PCM in a WAV header and write it with a single fsync."""
+    with open(path, "wb") as f:
+        with wave.open(f, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(sample_rate)
+            wav.writeframes(pcm)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _probe_device(device: str) -> bool:
+    """Check that ffmpeg can capture 50 ms from an avfoundation input."""
+    try:
+        probe = subprocess.run([
+            _FFMPEG_PATH, "-f", "avfoundation", "-i", device,
+            "-t", "0.05", "-f", "null", "-"
+        ], capture_output=True, timeout=5)
+        return probe.returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
 
 class SimpleMeetingRecorder:
     """
@@ -31,6 +112,12 @@ class SimpleMeetingRecorder:
         self.attendees = []
         self.verifier = VeriMinutesService()
         self.use_demo = False
+        self._stderr_buf: deque = deque(maxlen=256)
+        self._stderr_thread: Optional[threading.Thread] = None
+        self._pcm = bytearray()
+        self._pcm_thread: Optional[threading.Thread] = None
+        self._whisper = None
+        self._whisper_batched = False
 
     def start_recording(self, meeting_title: str, attendees: List[str], use_real_audio: bool = True) -> Dict:
         """Start recording audio using system commands."""
@@ -62,85 +149,47 @@ class SimpleMeetingRecorder:
         # Use ffmpeg for audio recording (works on macOS)
         try:
             # Check if ffmpeg is available
-            subprocess.run(["which", "ffmpeg"], check=True, capture_output=True)
-
-            # List available audio devices first
-            list_devices = subprocess.run([
-                "ffmpeg", "-f", "avfoundation", "-list_devices", "true", "-i", ""
-            ], capture_output=True, text=True)
-
-            print("📱 Available audio devices:")
-            audio_devices = []
-            for line in list_devices.stderr.split('\n'):
-                if '[AVFoundation indev @' in line and 'audio devices' not in line.lower():
-                    # Extract device index and name
-                    if '[' in line:
-                        device_info = line.split(']', 1)[1].strip() if ']' in line else line
-                        print(f"  {line.strip()}")
-                        # Try to extract device index
-                        if '[' in line:
-                            device_idx = line.split('[')[1].split(']')[0]
-                            audio_devices.append(device_idx)
-
-            # Try different audio input methods in order of preference
-            recording_started = False
-
-            # Method 1: Try with explicit device index
-            for device_idx in audio_devices:
-                if recording_started:
-                    break
-
-                print(f"🎤 Trying audio device [{device_idx}]...")
-                self.recording_process = subprocess.Popen([
-                    "ffmpeg",
-                    "-f", "avfoundation",
-                    "-i", f":{device_idx}",  # Use device index
-                    "-ar", "16000",
-                    "-ac", "1",
-                    "-acodec", "pcm_s16le",
-                    "-y",
-                    self.audio_file
-                ], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-
-                # Check if it started successfully
-                time.sleep(0.5)
-                if self.recording_process.poll() is None:
-                    print(f"✅ Recording started with device [{device_idx}]")
-                    recording_started = True
-                    break
-                else:
-                    stderr = self.recording_process.stderr.read().decode()[:200]
-                    print(f"   Failed: {stderr}")
-
-            # Method 2: Try with explicit device names
-            if not recording_started:
-                device_names = [":MacBook Pro Microphone", ":0", ":default"]
-                for device_name in device_names:
-                    print(f"🎤 Trying device name: {device_name}")
-                    self.recording_process = subprocess.Popen([
-                        "ffmpeg",
-                        "-f", "avfoundation",
-                        "-i", device_name,
-                        "-ar", "16000",
-                        "-ac", "1",
-                        "-acodec", "pcm_s16le",
-                        "-y",
-                        self.audio_file
-                    ], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-
-                    time.sleep(0.5)
-                    if self.recording_process.poll() is None:
-                        print(f"✅ Recording started with {device_name}")
-                        recording_started = True
-                        break
-
-            if recording_started:
-                print(f"🎙️ Recording audio to {self.audio_file}")
-                print("🔴 RECORDING NOW - Please speak clearly into your microphone")
-            else:
+            if _FFMPEG_PATH is None:
+                raise subprocess.CalledProcessError(1, "ffmpeg", "ffmpeg not found")
+
+            device = self._resolve_input_device()
+            if device is None:
                 print("❌ Failed to start audio recording with any method")
                 raise subprocess.CalledProcessError(1, "ffmpeg", "No audio device could be accessed")
 
+            self.recording_process = subprocess.Popen([
+                _FFMPEG_PATH,
+                "-loglevel", "warning",
+                "-f", "avfoundation",
+                "-i", device,
+                "-ar", "16000",
+                "-ac", "1",
+                "-f", "s16le",
+                "pipe:1"
+            ], stderr=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=1 << 20)
+
+            # Raw PCM is buffered in memory; the WAV file is written on stop
+            self._pcm = bytearray()
+            self._pcm_thread = threading.Thread(
+                target=_capture,
+                args=(self.recording_process.stdout, self._pcm),
+                daemon=True
+            )
+            self._pcm_thread.start()
+
+            # Keep draining stderr so a full pipe never blocks ffmpeg mid-recording
+            self._stderr_buf.clear()
+            self._stderr_thread = threading.Thread(
+                target=_drain,
+                args=(self.recording_process.stderr, self._stderr_buf),
+                daemon=True
+            )
+            self._stderr_thread.start()
+
+            print(f"✅ Recording started with device {device}")
+            print(f"🎙️ Recording audio (saved to {self.audio_file} on stop)")
+            print("🔴 RECORDING NOW - Please speak clearly into your microphone")
+
         except subprocess.CalledProcessError:
             # Fallback: create a mock recording for demo
             print("⚠️ ffmpeg not found - using demo mode")
@@ -168,6 +217,37 @@ class SimpleMeetingRecorder:
             "start_time": datetime.now().isoformat()
         }
 
+    def _resolve_input_device(self) -> Optional[str]:
+        """Find a working avfoundation audio input, trying the cached one first.
+
+        The winning device is persisted so later recordings skip probing.
+        """
+
+        try:
+            cached = _DEVICE_CACHE_FILE.read_text().strip()
+        except OSError:
+            cached = ""
+
+        if cached and _probe_device(cached):
+            return cached
+
+        candidates = [f":{idx}" for idx in _list_audio_devices()]
+        candidates += [":MacBook Pro Microphone", ":0", ":default"]
+
+        for device in dict.fromkeys(candidates):
+            if device == cached:
+                continue
+            print(f"🎤 Trying audio device {device}...")
+            if _probe_device(device):
+                try:
+                    _DEVICE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                    _DEVICE_CACHE_FILE.write_text(device)
+                except OSError:
+                    pass
+                return device
+
+        return None
+
     def stop_recording(self) -> Dict:
         """Stop recording and process the audio."""
 
@@ -189,23 +269,49 @@ class SimpleMeetingRecorder:
         if self.recording_process:
             try:
                 self.recording_process.terminate()
-                stdout, stderr = self.recording_process.communicate(timeout=2)
+                self.recording_process.wait(timeout=2)
+                if self._stderr_thread:
+                    self._stderr_thread.join(timeout=2)
+                    self._stderr_thread = None
+                stderr = b"".join(self._stderr_buf)
                 if stderr:
-                    stderr_text = stderr.decode()
-                    # Look for audio level information
-                    if 'mean_volume' in stderr_text or 'max_volume' in stderr_text:
+                    # Scan the raw bytes; only matching lines get decoded
+                    if b'mean_volume' in stderr or b'max_volume' in stderr:
                         print(f"📢 Audio levels from recording:")
-                        for line in stderr_text.split('\n'):
-                            if 'volume' in line.lower():
-                                print(f"   {line.strip()}")
+                        for line in stderr.split(b'\n'):
+                            if b'volume' in line.lower():
+                                print(f"   {line.decode(errors='replace').strip()}")
                     else:
-                        print(f"⚠️ FFmpeg output: {stderr_text[:500]}")
+                        print(f"⚠️ FFmpeg output: {stderr[:500].decode(errors='replace')}")
             except subprocess.TimeoutExpired:
                 self.recording_process.kill()
                 self.recording_process.wait()
             except Exception as e:
                 print(f"Error stopping recording process: {e}")
 
+            # ffmpeg has exited; mux the buffered PCM into the WAV file once
+            # the reader has drained the pipe
+            pcm_done = True
+            if self._pcm_thread:
+                self._pcm_thread.join(timeout=2)
+                if self._pcm_thread.is_alive():
+                    # Something still holds stdout open; kill ffmpeg so the reader hits EOF
+                    self.recording_process.kill()
+                    self.recording_process.wait()
+                    self._pcm_thread.join(timeout=2)
+                pcm_done = not self._pcm_thread.is_alive()
+                self._pcm_thread = None
+
+            if pcm_done:
+                try:
+                    _write_wav(self.audio_file, self._pcm)
+                except OSError as e:
+                    print(f"Error writing recording: {e}")
+            else:
+                # The reader may still append; detach its buffer from later processing
+                print("⚠️ Audio capture did not finish; recording not written")
+                self._pcm = bytearray()
+
         self.is_recording = False
         duration = time.time() - self.start_time if self.start_time else 0
 
@@ -216,6 +322,7 @@ class SimpleMeetingRecorder:
         # Reset state
         self.recording_process = None
         self.audio_file = None
+        self._pcm = bytearray()
         self.start_time = None
 
         return result
@@ -331,80 +438,71 @@ Meeting adjourned. Thank you everyone.
             print(f"📊 Audio file size: {file_size} bytes")
 
             if file_size > 1000:  # At least 1KB of audio
+                # Measure the levels while the Whisper model warms up
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    levels_future = executor.submit(self._compute_levels, self.audio_file)
+                    model_future = executor.submit(self._ensure_whisper_loaded)
+
                 # First, analyze the audio file to check if it contains sound
                 try:
-                    # Use ffmpeg to check audio levels
-                    audio_check = subprocess.run([
-                        "ffmpeg", "-i", self.audio_file, "-af", "volumedetect", "-f", "null", "-"
-                    ], capture_output=True, text=True, timeout=10)
-
-                    if audio_check.stderr:
-                        print("📢 Audio analysis:")
-                        for line in audio_check.stderr.split('\n'):
-                            if 'mean_volume' in line or 'max_volume' in line:
-                                print(f"   {line.strip()}")
-                                # Check if audio is too quiet (below -60 dB is essentially silence)
-                                if 'mean_volume' in line:
-                                    try:
-                                        volume = float(line.split(':')[1].strip().split()[0])
-                                        if volume < -60:
-                                            print("⚠️ WARNING: Audio appears to be silent or very quiet!")
-                                            print("🎙️ Please ensure:")
-                                            print("   1. Your microphone is not muted")
-                                            print("   2. Terminal/IDE has microphone permission in System Settings")
-                                            print("   3. You're speaking close enough to the microphone")
-                                    except:
-                                        pass
+                    mean_volume, max_volume = levels_future.result()
+
+                    print("📢 Audio analysis:")
+                    print(f"   mean_volume: {mean_volume:.1f} dB")
+                    print(f"   max_volume: {max_volume:.1f} dB")
+
+                    # Check if audio is too quiet (below -60 dB is essentially silence)
+                    if mean_volume < -60:
+                        print("⚠️ WARNING: Audio appears to be silent or very quiet!")
+                        print("🎙️ Please ensure:")
+                        print("   1. Your microphone is not muted")
+                        print("   2. Terminal/IDE has microphone permission in System Settings")
+                        print("   3. You're speaking close enough to the microphone")
                 except Exception as e:
                     print(f"Could not analyze audio levels: {e}")
 
                 # Try to transcribe with Whisper
                 try:
+                    model_future.result()
                     print("🎯 Transcribing audio with Whisper...")
-                    import whisper
-
-                    # Load Whisper model (base is fast and good enough)
-                    model = whisper.load_model("base")
-
-                    # Transcribe the audio with adjusted parameters for low volume
-                    result = model.transcribe(
-                        self.audio_file,
-                        language="en",
-                        fp16=False,  # Use FP32 for better accuracy
-                        verbose=True  # Show progress
-                    )
+                    # Hand Whisper the captured samples instead of re-reading the WAV
+                    audio = self._pcm_samples() if self._pcm else self.audio_file
+                    result = self._transcribe(audio)
 
                     print(f"📝 Whisper result: {result.get('text', '')[:100]}...")
 
-                    # Format transcript in Otter.ai style
-                    with open(transcript_file, 'w') as f:
-                        f.write(f"{self.meeting_title}\n")
-                        f.write(f"Date: {datetime.now().strftime('%Y-%m-%d')}\n")
-                        f.write(f"Attendees: {', '.join(self.attendees)}\n\n")
-
-                        # Check if we got any text at all
-                        full_text = result.get("text", "").strip()
-
-                        if full_text:
-                            # Write the transcribed text with segments if available
-                            segments = result.get("segments", [])
-                            if segments:
-                                for segment in segments:
-                                    timestamp_min = int(segment['start'] // 60)
-                                    timestamp_sec = int(segment['start'] % 60)
-                                    text = segment['text'].strip()
-                                    if text:
-                                        f.write(f"Speaker  {timestamp_min}:{timestamp_sec:02d}\n")
-                                        f.write(f"{text}\n\n")
-                            else:
-                                # No segments, just write the full text
-                                f.write("Speaker  0:00\n")
-                                f.write(full_text + "\n")
+                    # Format transcript in Otter.ai style, written in one go
+                    lines = [
+                        f"{self.meeting_title}\n"
+                        f"Date: {datetime.now().strftime('%Y-%m-%d')}\n"
+                        f"Attendees: {', '.join(self.attendees)}\n\n"
+                    ]
+
+                    # Check if we got any text at all
+                    full_text = result.get("text", "").strip()
+
+                    if full_text:
+                        # Write the transcribed text with segments if available
+                        segments = result.get("segments", [])
+                        if segments:
+                            lines.extend(
+                                f"Speaker  {int(seg['start'] // 60)}:{int(seg['start'] % 60):02d}\n"
+                                f"{seg['text'].strip()}\n\n"
+                                for seg in segments
+                                if seg['text'].strip()
+                            )
                         else:
-                            # No speech detected
-                            f.write("Speaker  0:00\n")
-                            f.write("[No speech detected in audio. Please speak clearly into microphone.]\n")
-                            print("⚠️ No speech detected by Whisper")
+                            # No segments, just write the full text
+                            lines.append(f"Speaker  0:00\n{full_text}\n")
+                    else:
+                        # No speech detected
+                        lines.append(
+                            "Speaker  0:00\n"
+                            "[No speech detected in audio. Please speak clearly into microphone.]\n"
+                        )
+                        print("⚠️ No speech detected by Whisper")
+
+                    Path(transcript_file).write_text("".join(lines))
 
                     print(f"✅ Transcription complete: {transcript_file}")
 
@@ -444,6 +542,91 @@ Meeting adjourned. Thank you everyone.
 
         return self._process_transcript(transcript_file)
 
+    def _compute_levels(self, audio_file: str) -> Tuple[float, float]:
+        """Return (mean, peak) level in dBFS of a 16-bit PCM WAV file."""
+
+        import numpy as np
+
+        with wave.open(audio_file, 'rb') as w:
+            frames = w.readframes(w.getnframes())
+
+        data = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+        if not len(data):
+            raise ValueError("no audio samples")
+
+        rms = np.sqrt(data @ data / len(data))
+        mean_db = 20 * np.log10(rms + 1e-9)
+        peak_db = 20 * np.log10(np.abs(data).max() + 1e-9)
+
+        return float(mean_db), float(peak_db)
+
+    def _ensure_whisper_loaded(self):
+        """Load the transcription model once and keep it on the recorder."""
+
+        if self._whisper is not None:
+            return self._whisper
+
+        try:
+            from faster_whisper import WhisperModel, BatchedInferencePipeline
+        except ImportError:
+            import whisper
+
+            # Load Whisper model (base is fast and good enough)
+            self._whisper = whisper.load_model("base")
+            self._whisper_batched = False
+        else:
+            model = WhisperModel("base", device="auto", compute_type="int8")
+            self._whisper = BatchedInferencePipeline(model=model)
+            self._whisper_batched = True
+
+        return self._whisper
+
+    def _pcm_samples(self):
+        """Return the captured PCM as float32 samples in [-1, 1) at 16 kHz."""
+
+        import numpy as np
+
+        samples = np.frombuffer(self._pcm, dtype=np.int16, count=len(self._pcm) // 2)
+        return samples.astype(np.float32) / 32768.0
+
+    def _transcribe(self, audio: Union[str, "np.ndarray"]) -> Dict:
+        """Transcribe a recording into Whisper-style ``text`` and ``segments``.
+
+        ``audio`` is a file path or a float32 sample array at 16 kHz; both
+        backends accept either.
+
+        Prefers faster-whisper's batched pipeline: Silero VAD splits speech
+        into chunks of at most 30 s, which go through the encoder in batches
+        without conditioning on previous text, with int8 weights. Falls back
+        to openai-whisper when faster-whisper is not installed. Either model
+        is loaded once and kept on the recorder for later meetings.
+        """
+
+        model = self._ensure_whisper_loaded()
+        if not self._whisper_batched:
+            return model.transcribe(
+                audio,
+                language="en",
+                fp16=False,  # Use FP32 for better accuracy
+                verbose=True  # Show progress
+            )
+
+        segments, _ = model.transcribe(
+            audio,
+            language="en",
+            batch_size=16,
+            condition_on_previous_text=False
+        )
+        segments = [
+            {"start": seg.start, "end": seg.end, "text": seg.text}
+            for seg in segments
+        ]
+
+        return {
+            "text": "".join(seg["text"] for seg in segments),
+            "segments": segments
+        }
+
     def _process_transcript(self, transcript_file: str) -> Dict:
         """Process transcript through VeriMinutes."""
 
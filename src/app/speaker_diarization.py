@@ -9,36 +9,125 @@ from pathlib import Path
 import json
 import pickle
 from datetime import datetime
-from scipy.spatial.distance import cosine
-from sklearn.cluster import DBSCAN
-import hashlib
+import blake3
+
+
+# rfftfreq bins for the 16 kHz analysis rate, keyed on segment length
+_FREQS_CACHE: Dict[int, np.ndarray] = {}
+_FREQS_CACHE_MAX = 64
+
+
+def _rfft_freqs(n: int) -> np.ndarray:
+    """Return (cached) rFFT bin frequencies for an n-sample segment."""
+    freqs = _FREQS_CACHE.get(n)
+    if freqs is None:
+        from scipy.fft import rfftfreq
+
+        if len(_FREQS_CACHE) >= _FREQS_CACHE_MAX:
+            _FREQS_CACHE.clear()
+        freqs = rfftfreq(n, 1/16000).astype(np.float32)
+        _FREQS_CACHE[n] = freqs
+    return freqs
 
 
 class SpeakerProfile:
     """Represents a speaker's voice profile."""
 
-    def __init__(self, name: str, embeddings: List[np.ndarray] = None):
+    # L2-normalized mean embedding; None until computed (also for old pickles)
+    _mean_unit: Optional[np.ndarray] = None
+
+    # Initial row capacity of the embedding matrix; doubled when full
+    INITIAL_CAPACITY = 16
+
+    def __init__(
+        self,
+        name: str,
+        embeddings: List[np.ndarray] = None,
+        profile_id: Optional[str] = None,
+        created_at: Optional[str] = None
+    ):
         self.name = name
-        self.embeddings = embeddings or []
-        self.id = hashlib.sha256(name.encode()).hexdigest()[:8]
-        self.created_at = datetime.now().isoformat()
+        self._id = profile_id
+        self.created_at = created_at if created_at is not None else datetime.now().isoformat()
+        self._reset_embeddings()
+        for embedding in embeddings if embeddings is not None else []:
+            self.add_embedding(embedding)
+
+    def __setstate__(self, state):
+        """Upgrade profiles pickled when embeddings were a Python list."""
+        legacy = state.pop("embeddings", None)
+        state.setdefault("_id", state.pop("id", None))
+        self.__dict__.update(state)
+        if legacy is not None:
+            self._reset_embeddings()
+            for embedding in legacy:
+                self.add_embedding(embedding)
+
+    @property
+    def id(self) -> str:
+        """Short non-cryptographic label, derived from the name on first use."""
+        if self._id is None:
+            self._id = blake3.blake3(self.name.encode()).hexdigest(length=4)
+        return self._id
+
+    @id.setter
+    def id(self, value: str):
+        self._id = value
+
+    def _reset_embeddings(self):
+        """Drop all embeddings; storage is allocated on the first add."""
+        self._emb: Optional[np.ndarray] = None
+        self._sum: Optional[np.ndarray] = None
+        self._n = 0
+        self._mean_unit = None
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """(N, D) float32 view of the stored embeddings."""
+        if self._emb is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._emb[:self._n]
 
     def add_embedding(self, embedding: np.ndarray):
         """Add a new voice embedding."""
-        self.embeddings.append(embedding)
+        if self._emb is None:
+            self._emb = np.empty((self.INITIAL_CAPACITY, len(embedding)), dtype=np.float32)
+            self._sum = np.zeros(len(embedding), dtype=np.float32)
+        elif self._n == len(self._emb):
+            grown = np.empty((2 * len(self._emb), self._emb.shape[1]), dtype=np.float32)
+            grown[:self._n] = self._emb
+            self._emb = grown
+
+        self._emb[self._n] = embedding
+        self._sum += self._emb[self._n]
+        self._n += 1
+        self._mean_unit = None
 
     def get_mean_embedding(self) -> Optional[np.ndarray]:
         """Get the average embedding for this speaker."""
-        if not self.embeddings:
+        if not self._n:
             return None
-        return np.mean(self.embeddings, axis=0)
+        return self._sum / self._n
+
+    def get_mean_unit(self) -> Optional[np.ndarray]:
+        """Get the L2-normalized mean embedding, cached until the next update."""
+        if self._mean_unit is None:
+            mean_emb = self.get_mean_embedding()
+            if mean_emb is None:
+                return None
+            self._mean_unit = (mean_emb / (np.linalg.norm(mean_emb) + 1e-9)).astype(np.float32)
+        return self._mean_unit
 
     def similarity(self, embedding: np.ndarray) -> float:
-        """Calculate similarity to another embedding (0-1, higher is more similar)."""
-        mean_emb = self.get_mean_embedding()
-        if mean_emb is None:
+        """Calculate similarity to another embedding (0-1, higher is more similar).
+
+        Embeddings from ``_extract_embedding`` are unit length, so the cosine
+        similarity reduces to a dot product with the normalized mean.
+        """
+        mean_unit = self.get_mean_unit()
+        if mean_unit is None:
             return 0.0
-        return 1.0 - cosine(mean_emb, embedding)
+        return float(mean_unit @ embedding)
 
 
 class SpeakerDiarizer:
@@ -47,6 +136,9 @@ class SpeakerDiarizer:
     Uses a simple embedding-based approach for speaker identification.
     """
 
+    # Number of low FFT bins used as an MFCC stand-in
+    N_MFCC = 13
+
     def __init__(
         self,
         similarity_threshold: float = 0.75,
@@ -70,27 +162,64 @@ class SpeakerDiarizer:
         self.session_embeddings: List[Tuple[np.ndarray, str]] = []
         self.unknown_counter = 0
 
+        # Stacked profile centroids for identify_speaker, rebuilt on enroll
+        self._centroid_matrix: Optional[np.ndarray] = None
+        self._centroid_names: List[str] = []
+        self._faiss = None
+
     def _load_profiles(self) -> Dict[str, SpeakerProfile]:
-        """Load saved speaker profiles."""
+        """Load saved speaker profiles.
+
+        Profiles are stored as one float32 embedding matrix per speaker in
+        ``profiles.npz`` plus a ``profiles.json`` sidecar with metadata. A
+        legacy ``profiles.pkl`` is still read if no npz store exists yet; it
+        is replaced on the next save.
+        """
         speakers = {}
-        profiles_file = self.profiles_path / "profiles.pkl"
+        arrays_file = self.profiles_path / "profiles.npz"
+        meta_file = self.profiles_path / "profiles.json"
+        legacy_file = self.profiles_path / "profiles.pkl"
 
-        if profiles_file.exists():
-            try:
-                with open(profiles_file, 'rb') as f:
+        try:
+            if arrays_file.exists() and meta_file.exists():
+                meta = json.loads(meta_file.read_text())
+                with np.load(arrays_file, allow_pickle=False) as data:
+                    for name, info in meta.items():
+                        speakers[name] = SpeakerProfile(
+                            name,
+                            data[info["key"]],
+                            profile_id=info["id"],
+                            created_at=info["created_at"]
+                        )
+                print(f"Loaded {len(speakers)} speaker profiles")
+            elif legacy_file.exists():
+                with open(legacy_file, 'rb') as f:
                     speakers = pickle.load(f)
                 print(f"Loaded {len(speakers)} speaker profiles")
-            except Exception as e:
-                print(f"Error loading profiles: {e}")
+        except Exception as e:
+            print(f"Error loading profiles: {e}")
 
         return speakers
 
     def save_profiles(self):
         """Save speaker profiles to disk."""
-        profiles_file = self.profiles_path / "profiles.pkl"
+        arrays_file = self.profiles_path / "profiles.npz"
+        meta_file = self.profiles_path / "profiles.json"
         try:
-            with open(profiles_file, 'wb') as f:
-                pickle.dump(self.speakers, f)
+            arrays = {}
+            meta = {}
+            for i, (name, profile) in enumerate(self.speakers.items()):
+                key = f"p{i}"
+                arrays[key] = profile.embeddings
+                meta[name] = {
+                    "key": key,
+                    "id": profile.id,
+                    "created_at": profile.created_at,
+                    "n": arrays[key].shape[0]
+                }
+
+            np.savez(arrays_file, **arrays)
+            meta_file.write_text(json.dumps(meta, indent=2))
             print(f"Saved {len(self.speakers)} speaker profiles")
         except Exception as e:
             print(f"Error saving profiles: {e}")
@@ -107,7 +236,7 @@ class SpeakerDiarizer:
             SpeakerProfile for the enrolled speaker
         """
         # Extract embeddings from audio samples
-        embeddings = [self._extract_embedding(sample) for sample in audio_samples]
+        embeddings = list(self._extract_embeddings(audio_samples))
 
         # Create or update profile
         if name in self.speakers:
@@ -118,6 +247,9 @@ class SpeakerDiarizer:
             profile = SpeakerProfile(name, embeddings)
             self.speakers[name] = profile
 
+        self._centroid_matrix = None
+        self._faiss = None
+
         # Save updated profiles
         self.save_profiles()
 
@@ -137,15 +269,24 @@ class SpeakerDiarizer:
         # Extract embedding
         embedding = self._extract_embedding(audio_segment)
 
-        # Find best matching speaker
+        # Find best matching speaker with one inner-product search
         best_match = None
         best_similarity = 0.0
 
-        for name, profile in self.speakers.items():
-            similarity = profile.similarity(embedding)
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = name
+        centroids = self._get_centroid_matrix(len(embedding))
+        if self._faiss is not None:
+            scores, ids = self._faiss.search(embedding[None, :].astype(np.float32), 1)
+            sim, idx = float(scores[0, 0]), int(ids[0, 0])
+        elif len(centroids):
+            sims = centroids @ embedding
+            idx = int(np.argmax(sims))
+            sim = float(sims[idx])
+        else:
+            sim, idx = 0.0, -1
+
+        if sim > best_similarity and idx >= 0:
+            best_similarity = sim
+            best_match = self._centroid_names[idx]
 
         # Check if similarity meets threshold
         if best_similarity >= self.similarity_threshold:
@@ -160,6 +301,32 @@ class SpeakerDiarizer:
 
         return speaker_name, best_similarity
 
+    def _get_centroid_matrix(self, dim: int) -> np.ndarray:
+        """Stack every profile's unit centroid into an (N, D) float32 matrix.
+
+        When faiss is installed the matrix is also loaded into an
+        ``IndexFlatIP`` so lookups use its SIMD inner-product kernels.
+        """
+        if self._centroid_matrix is None:
+            try:
+                import faiss
+            except ImportError:  # optional: numpy matrix-vector fallback
+                faiss = None
+
+            self._centroid_names = list(self.speakers)
+            rows = []
+            for name in self._centroid_names:
+                mean_unit = self.speakers[name].get_mean_unit()
+                rows.append(mean_unit if mean_unit is not None else np.zeros(dim, dtype=np.float32))
+            self._centroid_matrix = (
+                np.stack(rows).astype(np.float32)
+                if rows else np.empty((0, dim), dtype=np.float32)
+            )
+            if faiss is not None and rows:
+                self._faiss = faiss.IndexFlatIP(self._centroid_matrix.shape[1])
+                self._faiss.add(self._centroid_matrix)
+        return self._centroid_matrix
+
     def _extract_embedding(self, audio_segment: np.ndarray) -> np.ndarray:
         """
         Extract voice embedding from audio segment.
@@ -167,62 +334,85 @@ class SpeakerDiarizer:
         This is a simplified version using basic audio features.
         In production, you'd use a pre-trained model like Resemblyzer or SpeechBrain.
         """
+        # A single segment is already a one-row batch; skip the length grouping
+        audio = np.ascontiguousarray(np.ravel(audio_segment), dtype=np.float32)
+        return self._embed_batch(audio[None, :])[0]
+
+    def _extract_embeddings(self, audio_segments: List[np.ndarray]) -> np.ndarray:
+        """
+        Extract voice embeddings for several segments at once.
+
+        Segments of equal length are stacked and share one multithreaded
+        2-D rFFT; returns an (N, D) float32 matrix in input order.
+        """
         # Ensure audio is the right shape
-        if len(audio_segment.shape) == 1:
-            audio = audio_segment
-        else:
-            audio = audio_segment.flatten()
+        flat = [np.ravel(segment) for segment in audio_segments]
+
+        by_length: Dict[int, List[int]] = {}
+        for idx, audio in enumerate(flat):
+            by_length.setdefault(len(audio), []).append(idx)
+
+        embeddings = np.empty((len(flat), 4 + self.N_MFCC), dtype=np.float32)
+        for length, indices in by_length.items():
+            batch = np.stack([flat[idx] for idx in indices], dtype=np.float32)
+            embeddings[indices] = self._embed_batch(batch)
+
+        return embeddings
+
+    def _embed_batch(self, audio: np.ndarray) -> np.ndarray:
+        """Compute normalized feature vectors for an (N, L) float32 batch of segments.
+
+        The rFFT of float32 input is complex64, so every reduction below runs
+        on 4-byte lanes.
+        """
+
+        from scipy.fft import rfft
 
         # Simple feature extraction (for demo purposes)
         # In production, use a proper embedding model
+        n_samples = audio.shape[1]
 
-        # Extract basic features
-        features = []
+        # One FFT; magnitude and its running sum are shared by the spectral features
+        fft = rfft(audio, axis=1, workers=-1)
+        magnitude = np.abs(fft)
+        freqs = _rfft_freqs(n_samples)
+        cumsum = np.cumsum(magnitude, axis=1)
+        total = cumsum[:, -1]
+        voiced = total > 0
+        safe_total = np.where(voiced, total, 1.0)
 
         # 1. Spectral centroid (brightness)
-        fft = np.fft.rfft(audio)
-        magnitude = np.abs(fft)
-        freqs = np.fft.rfftfreq(len(audio), 1/16000)
-        if magnitude.sum() > 0:
-            centroid = np.sum(freqs * magnitude) / magnitude.sum()
-        else:
-            centroid = 0
-        features.append(centroid)
+        centroid = np.where(voiced, (magnitude @ freqs) / safe_total, 0.0)
 
         # 2. Zero crossing rate (pitch indicator)
-        zcr = np.sum(np.diff(np.sign(audio)) != 0) / len(audio)
-        features.append(zcr)
+        # Counts every change of sign(x) in {-1, 0, 1}, so steps into and out
+        # of exact-zero samples (silence, padding) count like np.diff(np.sign(x))
+        positive = audio > 0
+        negative = audio < 0
+        changes = (positive[:, 1:] ^ positive[:, :-1]) | (negative[:, 1:] ^ negative[:, :-1])
+        zcr = np.count_nonzero(changes, axis=1) / n_samples
 
         # 3. Energy (volume)
-        energy = np.sqrt(np.mean(audio ** 2))
-        features.append(energy)
+        energy = np.sqrt(np.einsum('ij,ij->i', audio, audio) / n_samples)
 
-        # 4. Spectral rolloff
-        cumsum = np.cumsum(magnitude)
-        if cumsum[-1] > 0:
-            rolloff = freqs[np.where(cumsum >= 0.85 * cumsum[-1])[0][0]]
-        else:
-            rolloff = 0
-        features.append(rolloff)
+        # 4. Spectral rolloff (first bin reaching 85% of the spectral mass)
+        rolloff_bin = np.count_nonzero(cumsum < 0.85 * total[:, None], axis=1)
+        rolloff = np.where(voiced, freqs[np.minimum(rolloff_bin, len(freqs) - 1)], 0.0)
 
         # 5. MFCCs (simplified - normally use librosa)
         # Here we just use FFT bins as a proxy
-        n_mfcc = 13
-        if len(magnitude) >= n_mfcc:
-            mfcc_proxy = magnitude[:n_mfcc]
-        else:
-            mfcc_proxy = np.pad(magnitude, (0, n_mfcc - len(magnitude)))
-        features.extend(mfcc_proxy)
+        mfcc_proxy = magnitude[:, :self.N_MFCC]
+        if mfcc_proxy.shape[1] < self.N_MFCC:
+            mfcc_proxy = np.pad(mfcc_proxy, ((0, 0), (0, self.N_MFCC - mfcc_proxy.shape[1])))
 
-        # Create embedding vector
-        embedding = np.array(features, dtype=np.float32)
+        # Create embedding vectors
+        embeddings = np.column_stack([centroid, zcr, energy, rolloff, mfcc_proxy]).astype(np.float32)
 
         # Normalize
-        norm = np.linalg.norm(embedding)
-        if norm > 0:
-            embedding = embedding / norm
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        np.divide(embeddings, norms, out=embeddings, where=norms > 0)
 
-        return embedding
+        return embeddings
 
     def cluster_session_speakers(self) -> Dict[str, List[int]]:
         """
@@ -234,12 +424,20 @@ class SpeakerDiarizer:
         if not self.session_embeddings:
             return {}
 
-        # Extract embeddings
-        embeddings = np.array([emb for emb, _ in self.session_embeddings])
+        from sklearn.cluster import DBSCAN
+
+        # Extract embeddings (already L2-normalized)
+        embeddings = np.asarray(
+            [emb for emb, _ in self.session_embeddings],
+            dtype=np.float32
+        )
+
+        # Cosine distances for every pair from a single matrix product
+        distances = np.clip(1.0 - embeddings @ embeddings.T, 0.0, 2.0)
 
         # Cluster using DBSCAN
-        clustering = DBSCAN(eps=0.3, min_samples=2, metric='cosine')
-        labels = clustering.fit_predict(embeddings)
+        clustering = DBSCAN(eps=0.3, min_samples=2, metric='precomputed')
+        labels = clustering.fit_predict(distances)
 
         # Group by cluster
         clusters = {}
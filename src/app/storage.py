@@ -1,9 +1,51 @@
-import json
+import os
 import shutil
+import tempfile
+import functools
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
-import re
+
+from .jsonio import dumps as _dumps, loads as _loads
+
+
+class _SlugTable(dict):
+    """str.translate table keeping a-z0-9 and mapping every other character to '-'."""
+
+    def __missing__(self, codepoint: int) -> str:
+        return '-'
+
+
+_SLUG_TABLE = _SlugTable({ord(c): ord(c) for c in 'abcdefghijklmnopqrstuvwxyz0123456789'})
+
+# Most CAS entries remembered as already stored; older ones are re-checked on disk
+CAS_SEEN_MAX = 4096
+
+
+def _write_manifest(manifest_path: Path, manifest: Dict[str, Any]):
+    """Write the manifest to a temp file and rename it into place atomically.
+
+    Each write gets its own temp file, so concurrent writers of one session
+    never clobber each other's data before the rename.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=manifest_path.parent, prefix=manifest_path.name + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_dumps(manifest))
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file 0600; keep the manifest readable like other artifacts
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, manifest_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 class StorageService:
@@ -12,6 +54,11 @@ class StorageService:
     def __init__(self, output_dir: str = "./output"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._session_dir_cache = functools.lru_cache(maxsize=128)(
+            self._ensure_session_dir
+        )
+        # (slug, algo, digest) entries known to be in CAS, least recently used first
+        self._cas_seen: "OrderedDict[Tuple[str, str, str], None]" = OrderedDict()
 
     def create_slug(
         self,
@@ -26,9 +73,15 @@ class StorageService:
         base_slug = date
 
         if title:
-            title_slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
+            # Splitting on '-' and dropping empty parts collapses runs and trims the ends
+            title_slug = '-'.join(
+                part for part in title.lower().translate(_SLUG_TABLE).split('-') if part
+            )
             base_slug = f"{date}-{title_slug}"
 
+        # A new session is about to be created; drop any stale cached dirs
+        self.invalidate_session_cache()
+
         # Check if this exact slug already exists
         final_slug = base_slug
         session_dir = self.output_dir / final_slug
@@ -48,14 +101,21 @@ class StorageService:
                     "version_timestamp": timestamp,
                     "is_version": True
                 }
-                (session_dir / "version.json").write_text(
-                    json.dumps(version_info, indent=2)
-                )
+                (session_dir / "version.json").write_bytes(_dumps(version_info))
 
         return final_slug
 
+    def invalidate_session_cache(self):
+        """Forget cached session dirs and CAS entries, e.g. after a session is deleted."""
+        self._session_dir_cache.cache_clear()
+        self._cas_seen.clear()
+
     def get_session_dir(self, slug: str) -> Path:
         """Get or create session directory."""
+        return self._session_dir_cache(slug)
+
+    def _ensure_session_dir(self, slug: str) -> Path:
+        """Create the session directory tree and return its path."""
 
         session_dir = self.output_dir / slug
         session_dir.mkdir(parents=True, exist_ok=True)
@@ -73,20 +133,32 @@ class StorageService:
     ) -> str:
         """Store an artifact in the session directory."""
 
+        path, _ = self.store_artifact_returning_bytes(slug, file_name, content)
+        return path
+
+    def store_artifact_returning_bytes(
+        self,
+        slug: str,
+        file_name: str,
+        content: Any
+    ) -> Tuple[str, bytes]:
+        """Store an artifact and return its path along with the bytes written."""
+
         session_dir = self.get_session_dir(slug)
         file_path = session_dir / file_name
 
         if isinstance(content, (dict, list)):
-            content_str = json.dumps(content, indent=2)
-            file_path.write_text(content_str, encoding='utf-8')
+            data = _dumps(content)
         elif isinstance(content, str):
-            file_path.write_text(content, encoding='utf-8')
+            data = content.encode('utf-8')
         elif isinstance(content, bytes):
-            file_path.write_bytes(content)
+            data = content
         else:
             raise ValueError(f"Unsupported content type: {type(content)}")
 
-        return str(file_path)
+        file_path.write_bytes(data)
+
+        return str(file_path), data
 
     def store_in_cas(
         self,
@@ -100,8 +172,46 @@ class StorageService:
         cas_dir = self.get_session_dir(slug) / "cas" / algo
         cas_file = cas_dir / hash_value
 
+        key = (slug, algo, hash_value)
+        if key in self._cas_seen:
+            self._cas_seen.move_to_end(key)
+            return str(cas_file)
+
+        # O_EXCL makes the existence check and the create a single syscall
+        try:
+            fd = os.open(cas_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+
+        self._cas_seen[key] = None
+        if len(self._cas_seen) > CAS_SEEN_MAX:
+            self._cas_seen.popitem(last=False)
+
+        return str(cas_file)
+
+    def link_alias(
+        self,
+        src_cas_path: str,
+        algo: str,
+        digest: str
+    ) -> str:
+        """Expose an existing CAS entry under another algorithm's digest.
+
+        Hardlinks the entry into the sibling ``cas/<algo>`` directory, falling
+        back to a copy when linking fails (e.g. across devices).
+        """
+
+        src = Path(src_cas_path)
+        cas_file = src.parent.parent / algo / digest
+
         if not cas_file.exists():
-            cas_file.write_bytes(content)
+            try:
+                os.link(src, cas_file)
+            except OSError:
+                shutil.copyfile(src, cas_file)
 
         return str(cas_file)
 
@@ -115,25 +225,28 @@ class StorageService:
             raise FileNotFoundError(f"Artifact not found: {file_path}")
 
         if file_name.endswith('.json'):
-            return json.loads(file_path.read_text(encoding='utf-8'))
+            return _loads(file_path.read_bytes())
         else:
             return file_path.read_text(encoding='utf-8')
 
-    def create_manifest(self, slug: str) -> Dict[str, Any]:
+    def create_manifest(self, slug: str, now: Optional[str] = None) -> Dict[str, Any]:
         """Create or update manifest for session."""
 
         session_dir = self.get_session_dir(slug)
         manifest_path = session_dir / "manifest.json"
 
+        if now is None:
+            now = datetime.utcnow().isoformat() + "Z"
+
         manifest = {
             "slug": slug,
-            "createdAt": datetime.utcnow().isoformat() + "Z",
-            "updatedAt": datetime.utcnow().isoformat() + "Z",
+            "createdAt": now,
+            "updatedAt": now,
             "artifacts": []
         }
 
         if manifest_path.exists():
-            existing = json.loads(manifest_path.read_text())
+            existing = _loads(manifest_path.read_bytes())
             manifest["createdAt"] = existing.get("createdAt", manifest["createdAt"])
 
         return manifest
@@ -147,31 +260,15 @@ class StorageService:
     ) -> str:
         """Update manifest with new artifact."""
 
-        session_dir = self.get_session_dir(slug)
-        manifest_path = session_dir / "manifest.json"
-
-        manifest = self.create_manifest(slug)
-
-        artifact_entry = {
-            "type": artifact_type,
-            "fileName": file_name,
-            "path": str(session_dir / file_name),
-            "createdAt": datetime.utcnow().isoformat() + "Z"
-        }
-
-        if metadata:
-            artifact_entry.update(metadata)
-
-        manifest["artifacts"] = [
-            a for a in manifest.get("artifacts", [])
-            if a.get("fileName") != file_name
-        ]
-        manifest["artifacts"].append(artifact_entry)
-        manifest["updatedAt"] = datetime.utcnow().isoformat() + "Z"
+        # One read and one write of manifest.json, with no create_manifest round-trip
+        with self.manifest_batch(slug) as batch:
+            batch.add(artifact_type, file_name, metadata)
 
-        manifest_path.write_text(json.dumps(manifest, indent=2))
+        return str(batch.manifest_path)
 
-        return str(manifest_path)
+    def manifest_batch(self, slug: str) -> "ManifestBatch":
+        """Collect several manifest updates and write them once on exit."""
+        return ManifestBatch(self, slug)
 
     def get_manifest(self, slug: str) -> Dict[str, Any]:
         """Get manifest for session."""
@@ -182,14 +279,74 @@ class StorageService:
         if not manifest_path.exists():
             return self.create_manifest(slug)
 
-        return json.loads(manifest_path.read_text())
+        return _loads(manifest_path.read_bytes())
 
     def list_sessions(self) -> List[str]:
         """List all session slugs."""
 
-        sessions = []
-        for path in self.output_dir.iterdir():
-            if path.is_dir() and not path.name.startswith('.'):
-                sessions.append(path.name)
+        # DirEntry.is_dir() reuses the type from the directory scan
+        with os.scandir(self.output_dir) as entries:
+            return sorted(
+                entry.name for entry in entries
+                if not entry.name.startswith('.') and entry.is_dir()
+            )
 
-        return sorted(sessions)
\ No newline at end of file
+
+class ManifestBatch:
+    """Buffered manifest updates for one session.
+
+    Use as ``with storage.manifest_batch(slug) as batch: batch.add(...)``;
+    the manifest is read and written once when the block exits cleanly.
+    """
+
+    def __init__(self, storage: StorageService, slug: str):
+        self.storage = storage
+        self.slug = slug
+        self.session_dir = storage.get_session_dir(slug)
+        self.manifest_path = self.session_dir / "manifest.json"
+        self._pending: Dict[str, Tuple[str, Optional[Dict[str, Any]]]] = {}
+
+    def __enter__(self) -> "ManifestBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+
+    def add(
+        self,
+        artifact_type: str,
+        file_name: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """Queue an artifact entry; a later entry for the same file replaces it."""
+        self._pending[file_name] = (artifact_type, metadata)
+
+    def flush(self) -> str:
+        """Merge the queued entries into the manifest and write it."""
+
+        now = datetime.utcnow().isoformat() + "Z"
+        if self.manifest_path.exists():
+            manifest = _loads(self.manifest_path.read_bytes())
+        else:
+            manifest = {"slug": self.slug, "createdAt": now, "updatedAt": now, "artifacts": []}
+
+        # Keyed by file name: a replaced artifact keeps its place, new ones go last
+        by_name = {a.get("fileName"): a for a in manifest.get("artifacts", [])}
+        for file_name, (artifact_type, metadata) in self._pending.items():
+            artifact_entry = {
+                "type": artifact_type,
+                "fileName": file_name,
+                "path": str(self.session_dir / file_name),
+                "createdAt": now
+            }
+            if metadata:
+                artifact_entry.update(metadata)
+            by_name[file_name] = artifact_entry
+        manifest["artifacts"] = list(by_name.values())
+        manifest["updatedAt"] = now
+
+        _write_manifest(self.manifest_path, manifest)
+        self._pending.clear()
+
+        return str(self.manifest_path)
@@ -8,6 +8,22 @@ from .schema import (
 )
 
 
+# Patterns used per transcript item, compiled once at import
+_VOTE_RE = re.compile(
+    r'(?P<passed>approved|passed|carried)'
+    r'|(?P<failed>failed|defeated|rejected)'
+    r'|(?P<votes_for>\d+)\s*(?:for|in favor|yes)'
+    r'|(?P<votes_against>\d+)\s*(?:against|no|opposed)'
+    r'|(?P<votes_abstain>\d+)\s*(?:abstain|abstention)'
+)
+_OWNER_RE = re.compile(r'(assign|assigned to|owner:|responsible:)\s*([A-Za-z]+)', re.IGNORECASE)
+_DUE_RE = re.compile(
+    r'(due|deadline|by|before)\s*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4})',
+    re.IGNORECASE
+)
+_ACTION_PREFIX_RE = re.compile(r'(action item:|todo:|AI:)', re.IGNORECASE)
+
+
 class MinutesStructurer:
     """Extract structured board minutes from normalized transcripts using heuristics."""
 
@@ -33,6 +49,14 @@ class MinutesStructurer:
         r'^topic:?\s*(.+)$'
     ]
 
+    # One alternation per category, so each check is a single scan. Keyword
+    # patterns run against lowercased text; agenda patterns against the original.
+    _MOTION_RE = re.compile('|'.join(f'(?:{p})' for p in MOTION_PATTERNS))
+    _DECISION_RE = re.compile('|'.join(f'(?:{p})' for p in DECISION_PATTERNS))
+    _ACTION_RE = re.compile('|'.join(f'(?:{p})' for p in ACTION_PATTERNS))
+    _AGENDA_RE = re.compile('|'.join(f'(?:{p})' for p in AGENDA_PATTERNS), re.IGNORECASE)
+    _AGENDA_RES = [re.compile(p, re.IGNORECASE) for p in AGENDA_PATTERNS]
+
     def __init__(self):
         self.motions: List[Motion] = []
         self.decisions: List[Decision] = []
@@ -51,8 +75,11 @@ class MinutesStructurer:
         self.actions = []
         self.agenda = []
 
+        # Lowercase every item once; motion extraction re-reads following items
+        lowers = [item.text.lower() for item in transcript.items]
+
         for i, item in enumerate(transcript.items):
-            text_lower = item.text.lower()
+            text_lower = lowers[i]
 
             if self._is_agenda_item(item.text):
                 agenda_text = self._extract_agenda_text(item.text)
@@ -60,7 +87,7 @@ class MinutesStructurer:
                     self.agenda.append(AgendaItem(item=agenda_text))
 
             if self._is_motion(text_lower):
-                motion = self._extract_motion(transcript.items, i)
+                motion = self._extract_motion(transcript.items, lowers, i)
                 if motion:
                     self.motions.append(motion)
 
@@ -89,46 +116,38 @@ class MinutesStructurer:
 
     def _is_agenda_item(self, text: str) -> bool:
         """Check if text appears to be an agenda item."""
-        for pattern in self.AGENDA_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return self._AGENDA_RE.search(text) is not None
 
     def _extract_agenda_text(self, text: str) -> Optional[str]:
         """Extract agenda item text."""
-        for pattern in self.AGENDA_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for regex in self._AGENDA_RES:
+            match = regex.search(text)
             if match:
                 return match.group(1) if len(match.groups()) > 0 else text
         return text.strip()
 
     def _is_motion(self, text_lower: str) -> bool:
         """Check if text contains motion-related keywords."""
-        for pattern in self.MOTION_PATTERNS:
-            if re.search(pattern, text_lower):
-                return True
-        return False
+        return self._MOTION_RE.search(text_lower) is not None
 
     def _is_decision(self, text_lower: str) -> bool:
         """Check if text contains decision-related keywords."""
-        for pattern in self.DECISION_PATTERNS:
-            if re.search(pattern, text_lower):
-                return True
-        return False
+        return self._DECISION_RE.search(text_lower) is not None
 
     def _is_action(self, text_lower: str) -> bool:
         """Check if text contains action-related keywords."""
-        for pattern in self.ACTION_PATTERNS:
-            if re.search(pattern, text_lower):
-                return True
-        return False
+        return self._ACTION_RE.search(text_lower) is not None
 
     def _extract_motion(
         self,
         items: List,
+        lowers: List[str],
         start_idx: int
     ) -> Optional[Motion]:
-        """Extract motion details from transcript items."""
+        """Extract motion details from transcript items.
+
+        ``lowers`` holds the lowercased text of every item in ``items``.
+        """
 
         motion_text = items[start_idx].text
         mover = items[start_idx].speaker
@@ -139,27 +158,31 @@ class MinutesStructurer:
         abstain_count = 0
 
         for i in range(start_idx + 1, min(start_idx + 10, len(items))):
-            text_lower = items[i].text.lower()
+            text_lower = lowers[i]
 
             if 'second' in text_lower:
                 seconder = items[i].speaker
 
-            if re.search(r'approved|passed|carried', text_lower):
+            # One scan finds the result keywords and the first count of each kind
+            passed = failed = False
+            counts: Dict[str, int] = {}
+            for match in _VOTE_RE.finditer(text_lower):
+                kind = match.lastgroup
+                if kind == "passed":
+                    passed = True
+                elif kind == "failed":
+                    failed = True
+                elif kind not in counts:
+                    counts[kind] = int(match.group(kind))
+
+            if passed:
                 vote_result = "PASSED"
-            elif re.search(r'failed|defeated|rejected', text_lower):
+            elif failed:
                 vote_result = "FAILED"
 
-            vote_match = re.search(r'(\d+)\s*(for|in favor|yes)', text_lower)
-            if vote_match:
-                for_count = int(vote_match.group(1))
-
-            against_match = re.search(r'(\d+)\s*(against|no|opposed)', text_lower)
-            if against_match:
-                against_count = int(against_match.group(1))
-
-            abstain_match = re.search(r'(\d+)\s*(abstain|abstention)', text_lower)
-            if abstain_match:
-                abstain_count = int(abstain_match.group(1))
+            for_count = counts.get("votes_for", for_count)
+            against_count = counts.get("votes_against", against_count)
+            abstain_count = counts.get("votes_abstain", abstain_count)
 
         return Motion(
             text=motion_text,
@@ -182,24 +205,16 @@ class MinutesStructurer:
 
         owner = speaker if speaker != "Unknown" else "TBD"
 
-        owner_match = re.search(
-            r'(assign|assigned to|owner:|responsible:)\s*([A-Za-z]+)',
-            text,
-            re.IGNORECASE
-        )
+        owner_match = _OWNER_RE.search(text)
         if owner_match:
             owner = owner_match.group(2)
 
         due = None
-        due_match = re.search(
-            r'(due|deadline|by|before)\s*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4})',
-            text,
-            re.IGNORECASE
-        )
+        due_match = _DUE_RE.search(text)
         if due_match:
             due = due_match.group(2)
 
-        action_text = re.sub(r'(action item:|todo:|AI:)', '', text, flags=re.IGNORECASE).strip()
+        action_text = _ACTION_PREFIX_RE.sub('', text).strip()
 
         return Action(
             owner=owner,
@@ -211,8 +226,6 @@ class MinutesStructurer:
         """Generate notes that preserve the original transcript exactly."""
 
         # Simply concatenate all transcript items as they were in the original file
-        full_transcript = ""
-        for item in transcript.items:
-            full_transcript += item.text + "\n"
+        full_transcript = "\n".join(item.text for item in transcript.items)
 
         return full_transcript.rstrip()  # Remove trailing newline
\ No newline at end of file
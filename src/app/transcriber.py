@@ -3,15 +3,15 @@ Speech-to-text transcription module using Whisper.
 Converts audio to text with timestamps and speaker labels.
 """
 
-import whisper
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-import json
 import wave
 import time
 from datetime import datetime, timedelta
 
+from .jsonio import dumps
+
 
 class TranscriptionSegment:
     """Represents a transcribed segment with speaker info."""
@@ -46,6 +46,8 @@ class MeetingTranscriber:
     """
     Transcribes meeting audio to text with speaker labels.
     Uses Whisper for transcription and integrates with speaker diarization.
+    Runs on faster-whisper (int8 on CPU, float16 on GPU) when installed and
+    falls back to openai-whisper otherwise.
     """
 
     def __init__(
@@ -66,13 +68,28 @@ class MeetingTranscriber:
         self.language = language
         self.device = device
 
-        # Load Whisper model
+        # Load Whisper model, preferring the CTranslate2 faster-whisper backend
         print(f"Loading Whisper model: {model_size}")
-        self.model = whisper.load_model(model_size, device=device)
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            import whisper
+
+            self.model = whisper.load_model(model_size, device=device)
+            self._faster = False
+        else:
+            # "default" lets CTranslate2 pick a type for the device it resolves
+            # (e.g. "auto" on a host without a GPU)
+            compute_type = {"cpu": "int8", "cuda": "float16"}.get(device, "default")
+            self.model = WhisperModel(model_size, device=device, compute_type=compute_type)
+            self._faster = True
 
         # Transcription cache
         self.segments: List[TranscriptionSegment] = []
 
+        # Scratch buffer for converting real-time chunks to float32
+        self._rt_buf: Optional[np.ndarray] = None
+
     def transcribe_audio(
         self,
         audio_path: str,
@@ -92,25 +109,45 @@ class MeetingTranscriber:
         print(f"Transcribing: {audio_path}")
 
         # Transcribe with Whisper
-        result = self.model.transcribe(
-            audio_path,
-            language=self.language,
-            word_timestamps=True,
-            verbose=False
-        )
+        if self._faster:
+            segments, _ = self.model.transcribe(
+                audio_path,
+                language=self.language,
+                word_timestamps=True
+            )
+            result = {"segments": [
+                {
+                    "text": seg.text,
+                    "start": seg.start,
+                    "end": seg.end,
+                    "avg_logprob": seg.avg_logprob
+                }
+                for seg in segments
+            ]}
+        else:
+            result = self.model.transcribe(
+                audio_path,
+                language=self.language,
+                word_timestamps=True,
+                verbose=False
+            )
 
         # Process segments
         self.segments = []
 
-        for segment in result["segments"]:
+        # Find speakers for all segments with one vectorized lookup
+        speakers = self._assign_speakers(
+            [segment["start"] for segment in result["segments"]],
+            [segment["end"] for segment in result["segments"]],
+            speaker_segments
+        )
+
+        for segment, speaker in zip(result["segments"], speakers):
             # Extract text and timing
             text = segment["text"].strip()
             start = segment["start"]
             end = segment["end"]
 
-            # Find speaker for this segment
-            speaker = self._find_speaker(start, end, speaker_segments)
-
             # Create transcription segment
             trans_segment = TranscriptionSegment(
                 text=text,
@@ -142,24 +179,38 @@ class MeetingTranscriber:
         Returns:
             Transcribed text or None if no speech
         """
-        # Ensure audio is float32 and normalized
-        if audio_chunk.dtype != np.float32:
-            audio_chunk = audio_chunk.astype(np.float32) / 32768.0
-
-        # Pad if too short (Whisper needs at least 0.1s)
+        # Whisper needs at least 0.1s; shorter chunks are zero-padded
+        n_samples = len(audio_chunk)
         min_samples = int(0.1 * sample_rate)
-        if len(audio_chunk) < min_samples:
-            audio_chunk = np.pad(audio_chunk, (0, min_samples - len(audio_chunk)))
+        needs_float = audio_chunk.dtype != np.float32
+
+        if needs_float or n_samples < min_samples:
+            # Convert and pad into a buffer reused across calls
+            size = max(n_samples, min_samples)
+            if self._rt_buf is None or len(self._rt_buf) < size:
+                self._rt_buf = np.empty(size, dtype=np.float32)
+            buf = self._rt_buf[:size]
+
+            # Ensure audio is float32 and normalized
+            if needs_float:
+                np.multiply(audio_chunk, np.float32(1.0 / 32768.0), out=buf[:n_samples])
+            else:
+                buf[:n_samples] = audio_chunk
+            buf[n_samples:] = 0.0
+            audio_chunk = buf
 
         # Transcribe
-        result = self.model.transcribe(
-            audio_chunk,
-            language=self.language,
-            verbose=False,
-            fp16=False
-        )
-
-        text = result["text"].strip()
+        if self._faster:
+            segments, _ = self.model.transcribe(audio_chunk, language=self.language)
+            text = "".join(seg.text for seg in segments).strip()
+        else:
+            result = self.model.transcribe(
+                audio_chunk,
+                language=self.language,
+                verbose=False,
+                fp16=False
+            )
+            text = result["text"].strip()
         return text if text else None
 
     def _find_speaker(
@@ -169,21 +220,37 @@ class MeetingTranscriber:
         speaker_segments: Optional[List[Tuple[float, float, str]]]
     ) -> str:
         """Find speaker for a given time range."""
+        return self._assign_speakers([start], [end], speaker_segments)[0]
+
+    def _assign_speakers(
+        self,
+        starts: List[float],
+        ends: List[float],
+        speaker_segments: Optional[List[Tuple[float, float, str]]]
+    ) -> List[str]:
+        """Label each (start, end) range with the first speaker span overlapping it.
+
+        Spans are sorted by start once. A running maximum of their end times
+        turns "first span ending at or after start" into a binary search, so
+        every lookup is O(log M) instead of a scan over all spans.
+        """
 
         if not speaker_segments:
-            return "Unknown"
+            return ["Unknown"] * len(starts)
 
-        # Find overlapping speaker segment
-        for seg_start, seg_end, speaker in speaker_segments:
-            # Check for overlap
-            if seg_start <= start <= seg_end or seg_start <= end <= seg_end:
-                return speaker
+        ordered = sorted(speaker_segments, key=lambda seg: seg[0])
+        span_starts = np.array([seg[0] for seg in ordered], dtype=np.float64)
+        span_reach = np.maximum.accumulate(
+            np.array([seg[1] for seg in ordered], dtype=np.float64)
+        )
 
-            # Check if segment is contained
-            if start <= seg_start and end >= seg_end:
-                return speaker
+        first = np.searchsorted(span_reach, np.asarray(starts, dtype=np.float64), side='left')
+        stop = np.searchsorted(span_starts, np.asarray(ends, dtype=np.float64), side='right')
 
-        return "Unknown"
+        return [
+            ordered[i][2] if i < j else "Unknown"
+            for i, j in zip(first.tolist(), stop.tolist())
+        ]
 
     def merge_short_segments(
         self,
@@ -262,15 +329,15 @@ class MeetingTranscriber:
     def _export_txt(self, output_path: Path, include_timestamps: bool):
         """Export as plain text."""
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for segment in self.segments:
-                if include_timestamps:
-                    timestamp = self._format_timestamp(segment.start_time)
-                    f.write(f"{segment.speaker}  {timestamp}\n")
-                else:
-                    f.write(f"{segment.speaker}: ")
+        if include_timestamps:
+            parts = [
+                f"{segment.speaker}  {self._format_timestamp(segment.start_time)}\n{segment.text}\n\n"
+                for segment in self.segments
+            ]
+        else:
+            parts = [f"{segment.speaker}: {segment.text}\n\n" for segment in self.segments]
 
-                f.write(f"{segment.text}\n\n")
+        output_path.write_text("".join(parts), encoding='utf-8')
 
     def _export_json(self, output_path: Path):
         """Export as JSON."""
@@ -282,24 +349,19 @@ class MeetingTranscriber:
             "segments": [seg.to_dict() for seg in self.segments]
         }
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        output_path.write_bytes(dumps(data))
 
     def _export_srt(self, output_path: Path):
         """Export as SRT subtitle file."""
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for i, segment in enumerate(self.segments, 1):
-                # Write index
-                f.write(f"{i}\n")
-
-                # Write timestamp
-                start = self._format_srt_time(segment.start_time)
-                end = self._format_srt_time(segment.end_time)
-                f.write(f"{start} --> {end}\n")
+        parts = [
+            f"{i}\n"
+            f"{self._format_srt_time(segment.start_time)} --> {self._format_srt_time(segment.end_time)}\n"
+            f"[{segment.speaker}] {segment.text}\n\n"
+            for i, segment in enumerate(self.segments, 1)
+        ]
 
-                # Write text with speaker
-                f.write(f"[{segment.speaker}] {segment.text}\n\n")
+        output_path.write_text("".join(parts), encoding='utf-8')
 
     def _format_timestamp(self, seconds: float) -> str:
         """Format seconds as MM:SS."""
@@ -322,28 +384,31 @@ class MeetingTranscriber:
         if not self.segments:
             return {}
 
-        # Calculate statistics
-        total_duration = self.segments[-1].end_time if self.segments else 0
-        total_words = sum(len(seg.text.split()) for seg in self.segments)
+        # Calculate statistics in a single pass over the segments
+        total_duration = self.segments[-1].end_time
+        total_words = 0
+        confidence_sum = 0.0
 
         # Speaker statistics
         speaker_stats = {}
         for segment in self.segments:
-            if segment.speaker not in speaker_stats:
-                speaker_stats[segment.speaker] = {
-                    "segments": 0,
-                    "duration": 0,
-                    "words": 0
-                }
-
-            speaker_stats[segment.speaker]["segments"] += 1
-            speaker_stats[segment.speaker]["duration"] += segment.end_time - segment.start_time
-            speaker_stats[segment.speaker]["words"] += len(segment.text.split())
+            words = len(segment.text.split())
+            total_words += words
+            confidence_sum += segment.confidence
+
+            stats = speaker_stats.setdefault(segment.speaker, {
+                "segments": 0,
+                "duration": 0,
+                "words": 0
+            })
+            stats["segments"] += 1
+            stats["duration"] += segment.end_time - segment.start_time
+            stats["words"] += words
 
         return {
             "total_duration": total_duration,
             "total_segments": len(self.segments),
             "total_words": total_words,
-            "avg_confidence": np.mean([s.confidence for s in self.segments]),
+            "avg_confidence": confidence_sum / len(self.segments),
             "speakers": speaker_stats
-        }
\ No newline at end of file
+        }
@@ -3,6 +3,7 @@
 Start the VeriMinutes server and automatically open the browser.
 """
 
+import socket
 import subprocess
 import time
 import webbrowser
@@ -11,15 +12,11 @@ import os
 from pathlib import Path
 
 def is_server_running(port=8787):
-    """Check if server is already running on the port."""
+    """Check if a server is accepting connections on the port."""
     try:
-        result = subprocess.run(
-            ["lsof", "-i", f":{port}"],
-            capture_output=True,
-            text=True
-        )
-        return bool(result.stdout.strip())
-    except:
+        with socket.create_connection(("localhost", port), timeout=0.05):
+            return True
+    except OSError:
         return False
 
 def start_server():
@@ -49,14 +46,18 @@ def start_server():
 
     # Wait a moment for server to start
     print("⏳ Waiting for server to start...")
-    max_attempts = 10
-    for i in range(max_attempts):
-        time.sleep(1)
+    # Poll with exponential backoff (25 ms doubling up to 1 s), for up to 10 s
+    deadline = time.monotonic() + 10
+    delay = 0.025
+    while True:
+        time.sleep(delay)
         if is_server_running(port):
             print("✅ Server is ready!")
             break
-        if i == max_attempts - 1:
+        if time.monotonic() >= deadline:
             print("⚠️  Server took longer than expected to start")
+            break
+        delay = min(delay * 2, 1.0)
 
     # Open the browser
     print(f"🌐 Opening browser to {url}")
@@ -0,0 +1,34 @@
+import os
+import pytest
+
+
+@pytest.fixture
+def tmp_bytes_path(tmp_path):
+    """Return a factory that stores bytes in a throwaway file and returns its path.
+
+    On Linux the file is an anonymous memfd reached through /proc/self/fd, so
+    nothing touches the filesystem and there is nothing to unlink; the
+    descriptors are closed at teardown. Elsewhere it falls back to tmp_path.
+    """
+
+    fds = []
+
+    def make(content: bytes) -> str:
+        if hasattr(os, "memfd_create"):
+            fd = os.memfd_create("veri", 0)
+            fds.append(fd)
+            view = memoryview(content)
+            while view:
+                view = view[os.write(fd, view):]
+            return f"/proc/self/fd/{fd}"
+
+        path = tmp_path / f"tmp{len(fds)}"
+        fds.append(None)
+        path.write_bytes(content)
+        return str(path)
+
+    yield make
+
+    for fd in fds:
+        if fd is not None:
+            os.close(fd)
@@ -0,0 +1,42 @@
+import hashlib
+import pytest
+from pathlib import Path
+
+from src.app import jsonio
+from src.app.storage import StorageService
+
+
+SAMPLE = {
+    "title": "Café board — Q3",
+    "notes": "Résumé: naïve façade, 東京, emoji 🎉\n\ttabbed \"quoted\" \\ back",
+    "scores": [0.1, 1e-05, 9.99e-05, 1e-07, 1e16, 2.5, -0.0, 100.0],
+    "empty": {"list": [], "dict": {}},
+    "flags": [True, False, None],
+    "count": 12345678901234,
+}
+
+
+class TestJsonIO:
+    def test_fallback_writes_raw_utf8(self):
+        data = jsonio._json_dumps({"notes": "café —"})
+
+        assert "café —".encode("utf-8") in data
+        assert b"\\u" not in data
+
+    def test_fallback_matches_orjson(self):
+        orjson = pytest.importorskip("orjson")
+
+        expected = orjson.dumps(SAMPLE, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        assert jsonio._json_dumps(SAMPLE) == expected
+
+    def test_round_trip(self):
+        assert jsonio.loads(jsonio.dumps(SAMPLE)) == jsonio.loads(jsonio._json_dumps(SAMPLE))
+
+    def test_stored_artifact_hash_independent_of_backend(self, tmp_path):
+        storage = StorageService(str(tmp_path))
+        path, data = storage.store_artifact_returning_bytes("2025-09-12-cafe", "minutes.json", SAMPLE)
+
+        # The digest a credential signs must not depend on whether orjson is installed
+        expected = hashlib.sha256(jsonio._json_dumps(SAMPLE)).hexdigest()
+        assert hashlib.sha256(data).hexdigest() == expected
+        assert hashlib.sha256(Path(path).read_bytes()).hexdigest() == expected
@@ -1,109 +1,145 @@
 import pytest
-import tempfile
+import hashlib
+import blake3
 from pathlib import Path
 
 from src.app.merkle import MerkleTree
 
 
+LEAF_ALGOS = ["sha256", "blake3"]
+
+
 class TestMerkleTree:
-    def test_single_chunk_file(self):
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
-            f.write(b"Small file content")
-            temp_path = f.name
-
-        try:
-            tree = MerkleTree()
-            result = tree.build_from_file(temp_path)
-
-            assert result["docPath"] == Path(temp_path).name
-            assert result["chunkSize"] == 65536
-            assert result["leafAlgo"] == "sha256"
-            assert len(result["leaves"]) == 1
-            assert result["merkleRoot"] != ""
-        finally:
-            Path(temp_path).unlink()
-
-    def test_multi_chunk_file(self):
+    @pytest.mark.parametrize("leaf_algo", LEAF_ALGOS)
+    def test_single_chunk_file(self, leaf_algo, tmp_bytes_path):
+        temp_path = tmp_bytes_path(b"Small file content")
+
+        tree = MerkleTree(leaf_algo=leaf_algo)
+        result = tree.build_from_file(temp_path)
+
+        assert result["docPath"] == Path(temp_path).name
+        assert result["chunkSize"] == 65536
+        assert result["leafAlgo"] == leaf_algo
+        assert len(result["leaves"]) == 1
+        assert result["merkleRoot"] != ""
+
+    def test_default_leaf_algo(self):
+        result = MerkleTree().build_from_bytes(b"Small file content", "doc.txt")
+
+        assert result["leafAlgo"] == "blake3"
+
+    @pytest.mark.parametrize("leaf_algo", LEAF_ALGOS)
+    def test_multi_chunk_file(self, leaf_algo, tmp_bytes_path):
         chunk_size = 1024
         data = b"A" * (chunk_size * 3 + 500)
 
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
-            f.write(data)
-            temp_path = f.name
+        temp_path = tmp_bytes_path(data)
 
-        try:
-            tree = MerkleTree(chunk_size=chunk_size)
-            result = tree.build_from_file(temp_path)
+        tree = MerkleTree(chunk_size=chunk_size, leaf_algo=leaf_algo)
+        result = tree.build_from_file(temp_path)
 
-            assert len(result["leaves"]) == 4
-            assert result["merkleRoot"] != ""
-            assert result["chunkSize"] == chunk_size
-        finally:
-            Path(temp_path).unlink()
+        assert len(result["leaves"]) == 4
+        assert result["merkleRoot"] != ""
+        assert result["chunkSize"] == chunk_size
 
-    def test_empty_file(self):
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
-            temp_path = f.name
+    def test_empty_file(self, tmp_bytes_path):
+        temp_path = tmp_bytes_path(b"")
 
-        try:
-            tree = MerkleTree()
-            result = tree.build_from_file(temp_path)
+        tree = MerkleTree()
+        result = tree.build_from_file(temp_path)
 
-            assert len(result["leaves"]) == 1
-            assert result["merkleRoot"] != ""
-        finally:
-            Path(temp_path).unlink()
+        assert len(result["leaves"]) == 1
+        assert result["merkleRoot"] != ""
 
-    def test_inclusion_proof(self):
+    @pytest.mark.parametrize("leaf_algo", LEAF_ALGOS)
+    def test_inclusion_proof(self, leaf_algo, tmp_bytes_path):
         data = b"Test data for inclusion proof"
 
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
-            f.write(data)
-            temp_path = f.name
+        temp_path = tmp_bytes_path(data)
+
+        tree = MerkleTree(leaf_algo=leaf_algo)
+        result = tree.build_from_file(temp_path)
+
+        leaf = result["leaves"][0]
+        proof = result["inclusion"]
+        root = result["merkleRoot"]
 
-        try:
-            tree = MerkleTree()
-            result = tree.build_from_file(temp_path)
+        assert tree.verify_inclusion(leaf, proof, root)
 
-            leaf = result["leaves"][0]
-            proof = result["inclusion"]
-            root = result["merkleRoot"]
+    def test_inclusion_proof_every_leaf(self):
+        tree = MerkleTree(chunk_size=16)
+        result = tree.build_from_bytes(bytes(range(16 * 11)), "doc.bin")
+        root = result["merkleRoot"]
+
+        for index, leaf in enumerate(result["leaves"]):
+            proof = tree._generate_inclusion_proof(index)
 
             assert tree.verify_inclusion(leaf, proof, root)
-        finally:
-            Path(temp_path).unlink()
+            assert MerkleTree().verify_inclusion(leaf, proof, root)
+            assert not tree.verify_inclusion("0" * 64, proof, root)
+
+    def test_forged_upper_siblings_rejected(self):
+        tree = MerkleTree(chunk_size=16)
+        result = tree.build_from_bytes(bytes(range(256)) * 2, "doc.bin")
+        root = result["merkleRoot"]
+        proof = tree._generate_inclusion_proof(5)
 
-    def test_verify_proof(self):
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
-            f.write(b"Content for verification")
-            temp_path = f.name
+        # Only the lower two levels are genuine; the rest of the path is forged
+        forged = dict(proof, siblings=proof["siblings"][:2] + ["ff" * 32] * (len(proof["siblings"]) - 2))
 
-        try:
-            tree = MerkleTree()
-            proof = tree.build_from_file(temp_path)
+        assert not tree.verify_inclusion(result["leaves"][5], forged, root)
+        assert not MerkleTree().verify_inclusion(result["leaves"][5], forged, root)
 
-            assert MerkleTree.verify_proof(temp_path, proof)
+    @pytest.mark.parametrize("leaf_algo", LEAF_ALGOS)
+    def test_verify_proof(self, leaf_algo, tmp_bytes_path):
+        temp_path = tmp_bytes_path(b"Content for verification")
 
-            proof["merkleRoot"] = "0" * 64
-            assert not MerkleTree.verify_proof(temp_path, proof)
-        finally:
-            Path(temp_path).unlink()
+        tree = MerkleTree(leaf_algo=leaf_algo)
+        proof = tree.build_from_file(temp_path)
 
-    def test_deterministic_hashing(self):
+        assert MerkleTree.verify_proof(temp_path, proof)
+
+        proof["merkleRoot"] = "0" * 64
+        assert not MerkleTree.verify_proof(temp_path, proof)
+
+    def test_deterministic_hashing(self, tmp_bytes_path):
         data = b"Deterministic test data"
 
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
-            f.write(data)
-            temp_path = f.name
+        temp_path = tmp_bytes_path(data)
+
+        tree1 = MerkleTree()
+        result1 = tree1.build_from_file(temp_path)
+
+        tree2 = MerkleTree()
+        result2 = tree2.build_from_file(temp_path)
+
+        assert result1["merkleRoot"] == result2["merkleRoot"]
+        assert result1["leaves"] == result2["leaves"]
+
+    @pytest.mark.parametrize("leaf_algo", LEAF_ALGOS)
+    def test_verify_proof_with_digest(self, leaf_algo, tmp_bytes_path):
+        data = b"B" * 3000
+
+        temp_path = tmp_bytes_path(data)
+
+        proof = MerkleTree(chunk_size=1024, leaf_algo=leaf_algo).build_from_file(temp_path)
+
+        tree = MerkleTree()
+        ok, sha256, blake3_hex, size = tree.verify_proof_with_digest(temp_path, proof)
+        assert ok
+        assert sha256 == hashlib.sha256(data).hexdigest()
+        assert blake3_hex == blake3.blake3(data).hexdigest()
+        assert size == len(data)
+        assert tree.root == proof["merkleRoot"]
+
+        proof["merkleRoot"] = "0" * 64
+        ok, _, _, _ = MerkleTree().verify_proof_with_digest(temp_path, proof)
+        assert not ok
 
-        try:
-            tree1 = MerkleTree()
-            result1 = tree1.build_from_file(temp_path)
+    def test_legacy_proof_defaults_to_sha256(self, tmp_bytes_path):
+        temp_path = tmp_bytes_path(b"Proof written before leafAlgo was recorded")
 
-            tree2 = MerkleTree()
-            result2 = tree2.build_from_file(temp_path)
+        proof = MerkleTree(leaf_algo="sha256").build_from_file(temp_path)
+        del proof["leafAlgo"]
 
-            assert result1["merkleRoot"] == result2["merkleRoot"]
-            assert result1["leaves"] == result2["leaves"]
-        finally:
-            Path(temp_path).unlink()
\ No newline at end of file
+        assert MerkleTree.verify_proof(temp_path, proof)
@@ -0,0 +1,154 @@
+import os
+import stat
+import threading
+import pytest
+
+from src.app.jsonio import loads
+from src.app import storage as storage_module
+from src.app.storage import StorageService, _write_manifest
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return StorageService(str(tmp_path / "output"))
+
+
+class TestManifestBatch:
+    def test_batch_writes_once_on_exit(self, storage):
+        slug = "2025-09-12-batch"
+
+        with storage.manifest_batch(slug) as batch:
+            batch.add("minutes", "minutes.json")
+            batch.add("pdf", "minutes.pdf", {"pages": 2})
+            assert not batch.manifest_path.exists()
+
+        manifest = loads(batch.manifest_path.read_bytes())
+        assert manifest["slug"] == slug
+        assert [a["fileName"] for a in manifest["artifacts"]] == ["minutes.json", "minutes.pdf"]
+        assert manifest["artifacts"][1]["type"] == "pdf"
+        assert manifest["artifacts"][1]["pages"] == 2
+
+    def test_manifest_accumulates_artifacts(self, storage):
+        slug = "2025-09-12-accumulate"
+
+        storage.update_manifest(slug, "transcript", "transcript.normalized.json")
+        created_at = storage.get_manifest(slug)["createdAt"]
+
+        with storage.manifest_batch(slug) as batch:
+            batch.add("minutes", "minutes.json")
+            batch.add("transcript", "transcript.normalized.json", {"replaced": True})
+
+        manifest = storage.get_manifest(slug)
+        # Earlier entries are kept; a replaced entry keeps its position
+        assert [a["fileName"] for a in manifest["artifacts"]] == [
+            "transcript.normalized.json", "minutes.json"
+        ]
+        assert manifest["artifacts"][0]["replaced"] is True
+        assert manifest["createdAt"] == created_at
+
+    def test_batch_discarded_on_error(self, storage):
+        slug = "2025-09-12-error"
+        storage.update_manifest(slug, "transcript", "transcript.normalized.json")
+
+        with pytest.raises(RuntimeError):
+            with storage.manifest_batch(slug) as batch:
+                batch.add("minutes", "minutes.json")
+                raise RuntimeError("build failed")
+
+        manifest = storage.get_manifest(slug)
+        assert [a["fileName"] for a in manifest["artifacts"]] == ["transcript.normalized.json"]
+
+    def test_failed_write_keeps_previous_manifest(self, storage):
+        slug = "2025-09-12-atomic"
+        manifest_path = storage.update_manifest(slug, "transcript", "transcript.normalized.json")
+        before = open(manifest_path, 'rb').read()
+
+        with pytest.raises(TypeError):
+            storage.update_manifest(slug, "minutes", "minutes.json", {"bad": object()})
+
+        assert open(manifest_path, 'rb').read() == before
+        assert not [n for n in os.listdir(os.path.dirname(manifest_path)) if n.endswith(".tmp")]
+
+
+class TestCasStore:
+    def test_seen_entries_are_bounded(self, storage, monkeypatch):
+        monkeypatch.setattr(storage_module, "CAS_SEEN_MAX", 3)
+        slug = "2025-09-12-cas"
+
+        for i in range(5):
+            storage.store_in_cas(slug, "sha256", f"digest{i}", b"blob %d" % i)
+
+        assert len(storage._cas_seen) == 3
+        assert (slug, "sha256", "digest0") not in storage._cas_seen
+        assert (slug, "sha256", "digest4") in storage._cas_seen
+
+    def test_evicted_entry_is_still_deduplicated(self, storage, monkeypatch):
+        monkeypatch.setattr(storage_module, "CAS_SEEN_MAX", 2)
+        slug = "2025-09-12-cas-dedup"
+
+        first = storage.store_in_cas(slug, "sha256", "digest0", b"original")
+        for i in range(1, 4):
+            storage.store_in_cas(slug, "sha256", f"digest{i}", b"other")
+        assert (slug, "sha256", "digest0") not in storage._cas_seen
+
+        # O_EXCL finds the existing file and leaves its content alone
+        again = storage.store_in_cas(slug, "sha256", "digest0", b"different")
+        assert again == first
+        assert open(first, 'rb').read() == b"original"
+        assert (slug, "sha256", "digest0") in storage._cas_seen
+
+    def test_link_alias_hardlinks(self, storage):
+        slug = "2025-09-12-alias"
+        src = storage.store_in_cas(slug, "sha256", "a" * 64, b"shared blob")
+
+        alias = storage.link_alias(src, "blake3", "b" * 64)
+
+        assert alias.endswith(os.path.join("cas", "blake3", "b" * 64))
+        assert os.path.samefile(src, alias)
+
+    def test_link_alias_copies_when_link_fails(self, storage, monkeypatch):
+        slug = "2025-09-12-alias-copy"
+        src = storage.store_in_cas(slug, "sha256", "a" * 64, b"shared blob")
+
+        def no_link(*args, **kwargs):
+            raise OSError("cross-device link")
+
+        monkeypatch.setattr(os, "link", no_link)
+        alias = storage.link_alias(src, "blake3", "b" * 64)
+
+        assert not os.path.samefile(src, alias)
+        assert open(alias, 'rb').read() == b"shared blob"
+
+
+class TestWriteManifest:
+    def test_concurrent_writes_leave_valid_manifest(self, tmp_path):
+        manifest_path = tmp_path / "manifest.json"
+        errors = []
+
+        def writer(n):
+            try:
+                for i in range(50):
+                    _write_manifest(manifest_path, {"writer": n, "i": i, "pad": "x" * 4096})
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        manifest = loads(manifest_path.read_bytes())
+        assert manifest["i"] == 49 and manifest["writer"] in range(4)
+        assert os.listdir(tmp_path) == ["manifest.json"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_manifest_mode(self, tmp_path):
+        manifest_path = tmp_path / "manifest.json"
+
+        _write_manifest(manifest_path, {"slug": "a"})
+        _write_manifest(manifest_path, {"slug": "b"})
+
+        assert stat.S_IMODE(manifest_path.stat().st_mode) == 0o644
+        assert loads(manifest_path.read_bytes()) == {"slug": "b"}
@@ -1,113 +1,116 @@
 import pytest
-import tempfile
 import json
 from pathlib import Path
 
 from src.app.service import VeriMinutesService
-from src.app.schema import Transcript_v1, TranscriptItem, TranscriptMetadata
+from src.app.jsonio import dumps, loads
+
+
+@pytest.fixture(scope="module")
+def service():
+    # One instance per module: loading the service and its signing key once is enough
+    return VeriMinutesService()
 
 
 class TestVerification:
-    def setup_method(self):
-        self.service = VeriMinutesService()
-
-    def test_end_to_end_verification(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Alice: Welcome to the Q3 board meeting.\n")
-            f.write("Bob: Thank you for having me.\n")
-            f.write("Alice: Motion to approve the Q2 minutes.\n")
-            f.write("Bob: I second the motion.\n")
-            f.write("Alice: All in favor? Motion passed.\n")
-            f.write("Alice: Action item: Bob will prepare Q4 forecast by October 1.\n")
-            temp_path = f.name
-
-        try:
-            slug, _, _ = self.service.ingest_transcript(
-                temp_path,
-                date="2025-09-12",
-                attendees="Alice,Bob",
-                title="Q3 Board"
-            )
-
-            paths = self.service.build_artifacts(slug)
-            assert paths["minutes"]
-            assert paths["minutes_cred"]
-            assert paths["minutes_proof"]
-            assert paths["packet"]
-            assert paths["pdf"]
-
-            result = self.service.verify_artifacts(slug)
-            assert result.valid
-            assert result.localRoot != ""
-            assert result.docHash != ""
-
-        finally:
-            Path(temp_path).unlink()
-
-    def test_tampered_file_detection(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Alice: Original meeting content.\n")
-            temp_path = f.name
-
-        try:
-            slug, _, _ = self.service.ingest_transcript(
-                temp_path,
-                date="2025-09-12",
-                title="Test Meeting"
-            )
-
-            paths = self.service.build_artifacts(slug)
-
-            minutes_path = Path(paths["minutes"])
-            minutes_data = json.loads(minutes_path.read_text())
-            minutes_data["title"] = "TAMPERED TITLE"
-            minutes_path.write_text(json.dumps(minutes_data))
-
-            result = self.service.verify_artifacts(slug)
-            assert not result.valid
-
-        finally:
-            Path(temp_path).unlink()
-
-    def test_credential_signature_verification(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Test: Content for signature verification.\n")
-            temp_path = f.name
-
-        try:
-            slug, _, _ = self.service.ingest_transcript(temp_path)
-            paths = self.service.build_artifacts(slug)
-
-            cred_path = Path(paths["minutes_cred"])
-            cred_data = json.loads(cred_path.read_text())
-
-            cred_data["signature"] = "InvalidSignature=="
-            cred_path.write_text(json.dumps(cred_data))
-
-            result = self.service.verify_artifacts(slug)
-            assert not result.valid
-
-        finally:
-            Path(temp_path).unlink()
-
-    def test_merkle_proof_verification(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Speaker: Content for Merkle proof testing.\n")
-            temp_path = f.name
-
-        try:
-            slug, _, _ = self.service.ingest_transcript(temp_path)
-            paths = self.service.build_artifacts(slug)
-
-            proof_path = Path(paths["minutes_proof"])
-            proof_data = json.loads(proof_path.read_text())
-
-            original_root = proof_data["merkleRoot"]
-            proof_data["merkleRoot"] = "0" * 64
-            proof_path.write_text(json.dumps(proof_data))
-
-            result = self.service.verify_artifacts(slug)
-            assert result.localRoot != proof_data["merkleRoot"]
-
-        finally:
-            Path(temp_path).unlink()
\ No newline at end of file
+    def test_end_to_end_verification(self, service, tmp_bytes_path):
+        temp_path = tmp_bytes_path(
+            b"Alice: Welcome to the Q3 board meeting.\n"
+            b"Bob: Thank you for having me.\n"
+            b"Alice: Motion to approve the Q2 minutes.\n"
+            b"Bob: I second the motion.\n"
+            b"Alice: All in favor? Motion passed.\n"
+            b"Alice: Action item: Bob will prepare Q4 forecast by October 1.\n"
+        )
+
+        slug, _, _ = service.ingest_transcript(
+            temp_path,
+            date="2025-09-12",
+            attendees="Alice,Bob",
+            title="Q3 Board"
+        )
+
+        paths = service.build_artifacts(slug)
+        assert paths["minutes"]
+        assert paths["minutes_cred"]
+        assert paths["minutes_proof"]
+        assert paths["packet"]
+        assert paths["pdf"]
+
+        result = service.verify_artifacts(slug)
+        assert result.valid
+        assert result.localRoot != ""
+        assert result.docHash != ""
+
+    def test_tampered_file_detection(self, service, tmp_bytes_path):
+        temp_path = tmp_bytes_path(b"Alice: Original meeting content.\n")
+
+        slug, _, _ = service.ingest_transcript(
+            temp_path,
+            date="2025-09-12",
+            title="Test Meeting"
+        )
+
+        paths = service.build_artifacts(slug)
+
+        minutes_path = Path(paths["minutes"])
+        minutes_data = loads(minutes_path.read_bytes())
+        minutes_data["title"] = "TAMPERED TITLE"
+        minutes_path.write_bytes(dumps(minutes_data))
+
+        result = service.verify_artifacts(slug)
+        assert not result.valid
+
+    def test_credential_signature_verification(self, service, tmp_bytes_path):
+        temp_path = tmp_bytes_path(b"Test: Content for signature verification.\n")
+
+        slug, _, _ = service.ingest_transcript(temp_path)
+        paths = service.build_artifacts(slug)
+
+        cred_path = Path(paths["minutes_cred"])
+        cred_data = loads(cred_path.read_bytes())
+
+        cred_data["signature"] = "InvalidSignature=="
+        cred_path.write_bytes(dumps(cred_data))
+
+        result = service.verify_artifacts(slug)
+        assert not result.valid
+
+    @pytest.mark.parametrize("field, value", [("size", 1), ("blake3", "0" * 64)])
+    def test_credential_field_tamper_detection(self, service, tmp_bytes_path, field, value):
+        temp_path = tmp_bytes_path(b"Test: Content for credential field checks.\n")
+
+        slug, _, _ = service.ingest_transcript(temp_path)
+        paths = service.build_artifacts(slug)
+
+        assert service.verify_artifacts(slug).valid
+
+        cred_path = Path(paths["minutes_cred"])
+        cred_data = loads(cred_path.read_bytes())
+
+        # Re-sign so only the tampered field, not the signature, can fail
+        cred_data[field] = value
+        del cred_data["signature"]
+        canonical = json.dumps(cred_data, sort_keys=True, separators=(',', ':'))
+        cred_data["signature"] = service.hasher.sign_data(canonical.encode('utf-8'))
+        cred_path.write_bytes(dumps(cred_data))
+
+        assert service.hasher.verify_credential_signature(cred_data)
+        result = service.verify_artifacts(slug)
+        assert not result.valid
+
+    def test_merkle_proof_verification(self, service, tmp_bytes_path):
+        temp_path = tmp_bytes_path(b"Speaker: Content for Merkle proof testing.\n")
+
+        slug, _, _ = service.ingest_transcript(temp_path)
+        paths = service.build_artifacts(slug)
+
+        proof_path = Path(paths["minutes_proof"])
+        proof_data = loads(proof_path.read_bytes())
+
+        original_root = proof_data["merkleRoot"]
+        proof_data["merkleRoot"] = "0" * 64
+        proof_path.write_bytes(dumps(proof_data))
+
+        result = service.verify_artifacts(slug)
+        assert result.localRoot != proof_data["merkleRoot"]
\ No newline at end of file